@@ -1,3 +1,5 @@
+import ezdxf
+import numpy as np
 import pytest
 
 from viaconstructor import calc
@@ -16,6 +18,29 @@ def test_rotate_list(rlist, idx, expected):
     assert result == expected
 
 
+@pytest.mark.parametrize(
+    "lines, expected",
+    (
+        (
+            [
+                ((0.0, 0.0), (10.0, 0.0)),
+                ((0.0, 5.0), (10.0, 5.0)),
+                ((12.0, 1.0), (1.0, 1.0)),
+            ],
+            [
+                ((0.0, 0.0), (10.0, 0.0)),
+                ((10.0, 0.0), (12.0, 1.0)),
+                ((12.0, 1.0), (1.0, 1.0)),
+                ((0.0, 5.0), (10.0, 5.0)),
+            ],
+        ),
+        ([], []),
+    ),
+)
+def test_lines_to_path(lines, expected):
+    assert calc.lines_to_path(lines, max_vdist=1, max_dist=3) == expected
+
+
 @pytest.mark.parametrize(
     "p1, p2, expected",
     (
@@ -51,6 +76,17 @@ def test_calc_distance(p1, p2, expected):
     assert round(calc.calc_distance(p1, p2), 5) == round(expected, 5)
 
 
+@pytest.mark.parametrize(
+    "points, closed, expected",
+    (
+        ([(0, 0, 0), (3, 4, 0), (3, 10, 0)], False, [0.0, 5.0, 11.0]),
+        ([(0, 0, 0), (3, 4, 0), (0, 4, 0)], True, [0.0, 5.0, 8.0, 12.0]),
+    ),
+)
+def test_path_distances(points, closed, expected):
+    assert calc.path_distances(points, closed).tolist() == expected
+
+
 @pytest.mark.parametrize(
     "p1, p2, p3, expected",
     (
@@ -85,14 +121,51 @@ def test_calc_face(p1, p2, expected):
 
 
 @pytest.mark.parametrize(
-    "p1, p2, expected",
+    "starts, ends, point, expected",
     (
-        ((123, 345), (678, 890), -0.30853603576416455),
-        ((678, 890), (123, 345), 0.30853603576416455),
+        ([(123, 345)], [(678, 890)], (0, 0), -0.30853603576416455),
+        ([(678, 890)], [(123, 345)], (0, 0), 0.30853603576416455),
+        (
+            [(0, 0), (10, 0), (10, 10), (0, 10)],
+            [(10, 0), (10, 10), (0, 10), (0, 0)],
+            (5, 5),
+            6.283185307179586,
+        ),
     ),
 )
-def test_angle_2d(p1, p2, expected):
-    assert calc.angle_2d(p1, p2) == expected
+def test_angle_sum(starts, ends, point, expected):
+    result = calc.angle_sum(np.array(starts), np.array(ends), point)
+    assert round(result, 9) == round(expected, 9)
+
+
+@pytest.mark.parametrize(
+    "start, end, bulge",
+    (
+        ((0.0, 0.0), (10.0, 0.0), 1.0),
+        ((0.0, 0.0, 0.5), (10.0, 10.0, 0.0), 0.5),
+        ((5.0, 5.0), (-5.0, 5.0), -0.25),
+    ),
+)
+def test_bulge_to_arc(start, end, bulge):
+    center, start_angle, end_angle, radius = ezdxf.math.bulge_to_arc(start, end, bulge)
+    expected = ((center.x, center.y), start_angle, end_angle, radius)
+    assert calc.bulge_to_arc(start, end, bulge) == expected
+    assert calc.bulge_to_arc(start, end, bulge) == expected
+
+
+@pytest.mark.parametrize(
+    "start, end, other_start, other_end",
+    (
+        ((0.0, 0.0), (1.0, 0.0), (-0.0, -0.0), (1.0, -0.0)),
+        ((-0.0, -0.0), (1.0, -0.0), (0.0, 0.0), (1.0, 0.0)),
+    ),
+)
+def test_bulge_to_arc_signed_zero(start, end, other_start, other_end):
+    center, start_angle, end_angle, radius = ezdxf.math.bulge_to_arc(start, end, 1.0)
+    expected = ((center.x, center.y), start_angle, end_angle, radius)
+    # the same points with the other zero sign must not share a cached result
+    calc.bulge_to_arc(other_start, other_end, 1.0)
+    assert calc.bulge_to_arc(start, end, 1.0) == expected
 
 
 @pytest.mark.parametrize(
@@ -250,6 +323,30 @@ def test_is_inside_polygon(obj, point, expected):
     assert calc.is_inside_polygon(obj, point) == expected
 
 
+@pytest.mark.parametrize(
+    "segments, expected",
+    (
+        (
+            [
+                VcSegment({"start": (0.0, 0.0, 0.0), "end": (10.0, 0.0, 0.0)}),
+                VcSegment(
+                    {"start": (10.0, 0.0, 0.0), "end": (0.0, 0.0, 0.0), "bulge": 1.0}
+                ),
+            ],
+            (
+                [[0.0, 0.0], [10.0, 0.0]],
+                [[10.0, 0.0], [0.0, 0.0]],
+                [0.0, 1.0],
+            ),
+        ),
+        ([], ([], [], [])),
+    ),
+)
+def test_segments2arrays(segments, expected):
+    result = tuple(array.tolist() for array in calc.segments2arrays(segments))
+    assert result == expected
+
+
 @pytest.mark.parametrize(
     "obj, expected",
     (
@@ -674,6 +771,28 @@ def test_inside_vertex(vertex_data, point, expected):
     assert calc.inside_vertex(vertex_data, point) == expected
 
 
+@pytest.mark.parametrize(
+    "vertex_data, no_bulge, scale, expected",
+    (
+        (
+            [[40.0, 60.0], [30.0, 10.0], [0.0, 0.5]],
+            False,
+            1.0,
+            [(40.0, 30.0, 0.0), (60.0, 10.0, 0.5)],
+        ),
+        (
+            [[40.0, 60.0], [30.0, 10.0], [0.0, 0.5]],
+            True,
+            100.0,
+            [(4000.0, 3000.0), (6000.0, 1000.0)],
+        ),
+        ([[], [], []], True, 1.0, []),
+    ),
+)
+def test_vertex2points(vertex_data, no_bulge, scale, expected):
+    assert calc.vertex2points(vertex_data, no_bulge, scale) == expected
+
+
 @pytest.mark.parametrize(
     "obj, expected, expected_minmax",
     (
@@ -956,3 +1075,147 @@ def test_objects2polyline_offsets(
             for value in axis:
                 result.append(round(value, 6))
     assert result == expected
+
+
+@pytest.mark.parametrize(
+    "points, transform",
+    (
+        ([(0.1, 0.7), (33.3, -12.9), (-7.77, 101.3)], "move"),
+        ([(0.1, 0.7), (33.3, -12.9), (-7.77, 101.3)], "vertical"),
+        ([(0.1, 0.7), (33.3, -12.9), (-7.77, 101.3)], "horizontal"),
+        ([(0.1, 0.7), (33.3, -12.9), (-7.77, 101.3)], "rotate"),
+        ([(1.0 / 3.0, 2.0 / 7.0), (123.456, 0.3), (-0.1, -0.2)], "rotate"),
+    ),
+)
+def test_minmax_transforms(points, transform):
+    segments = [
+        VcSegment({"start": start, "end": end, "bulge": 0.0})
+        for start, end in zip(points, points[1:] + points[:1])
+    ]
+    objects = {0: VcObject({"segments": segments, "closed": True})}
+    min_max = calc.objects2minmax(objects)
+    if transform == "move":
+        calc.move_objects(objects, -min_max[0] - 0.3, -min_max[1] / 3.0)
+        result = calc.move_minmax(min_max, -min_max[0] - 0.3, -min_max[1] / 3.0)
+    elif transform == "rotate":
+        calc.rotate_objects(objects, min_max)
+        result = calc.rotate_minmax(min_max)
+    else:
+        calc.mirror_objects(objects, min_max, **{transform: True})
+        result = calc.mirror_minmax(min_max, **{transform: True})
+    assert result == calc.objects2minmax(objects)
+
+
+@pytest.mark.parametrize(
+    "line_start, line_end",
+    (
+        ((0.0, 0.0), (10.0, 10.0)),
+        ((10.0, 0.0), (0.0, 10.0)),
+        ((-5.0, 5.0), (5.0, 5.0)),
+    ),
+)
+def test_lines_intersect_mask(line_start, line_end):
+    starts = np.array(
+        [(0.0, 5.0), (5.0, -1.0), (20.0, 20.0), (0.0, 0.0), (2.0, 2.0), (6.0, 5.0)]
+    )
+    ends = np.array(
+        [(10.0, 5.0), (5.0, 11.0), (30.0, 30.0), (0.0, 0.0), (4.0, 4.0), (6.0, 9.0)]
+    )
+    result = calc.lines_intersect_mask(line_start, line_end, starts, ends)
+    expected = [
+        calc.lines_intersect(line_start, line_end, tuple(start), tuple(end)) is not None
+        for start, end in zip(starts, ends)
+    ]
+    assert result.tolist() == expected
+
+
+@pytest.mark.parametrize(
+    "mpos",
+    ((0.0, 0.0), (10.0, 1.0), (10.0, 5.0), (25.0, 0.0), (100.0, 100.0)),
+)
+def test_found_next_open_segment_points(mpos):
+    objects = {}
+    for obj_idx, (start, end) in enumerate(
+        (
+            ((0.0, 0.0), (10.0, 0.0)),
+            ((12.0, 0.0), (20.0, 0.0)),
+            ((10.0, 8.0), (0.0, 8.0)),
+        )
+    ):
+        segment = VcSegment({"start": start, "end": end, "bulge": 0.0})
+        objects[obj_idx] = VcObject({"segments": [segment], "closed": False})
+    objects[3] = VcObject(
+        {
+            "segments": [
+                VcSegment({"start": (10.0, 1.0), "end": (10.0, 2.0), "bulge": 0.0}),
+                VcSegment({"start": (10.0, 2.0), "end": (10.0, 1.0), "bulge": 0.0}),
+            ],
+            "closed": True,
+        }
+    )
+    nearest = calc.found_next_open_segment_point(mpos, objects)
+    expected = ()
+    if nearest:
+        expected = calc.found_next_open_segment_point(
+            mpos, objects, max_dist=10.0, exclude=(nearest[2], nearest[3])
+        )
+    assert calc.found_next_open_segment_points(mpos, objects, max_dist=10.0) == (
+        nearest,
+        expected,
+    )
+
+
+@pytest.mark.parametrize(
+    "setup",
+    (
+        {},
+        {"mill": {"depth": -4.0, "active": True}, "view": {"color": (1.0, 0.5)}},
+        {"tool": {"tooltable": [{"number": 1, "diameter": 2.0}], "name": "x"}},
+    ),
+)
+def test_copy_setup(setup):
+    result = calc.copy_setup(setup)
+    assert result == setup
+    if "tool" in setup:
+        result["tool"]["tooltable"][0]["number"] = 2
+        assert setup["tool"]["tooltable"][0]["number"] == 1
+
+
+@pytest.mark.parametrize(
+    "data, expected",
+    (
+        ({}, False),
+        ({"view": {"color": [0.5, 0.5, 0.5], "grid": 10}}, False),
+        ({"view": {"color": [1.0, 0.5, 0.5]}}, True),
+        ({"mill": {"tooltable": [{"number": 1}]}}, False),
+        ({"mill": {"tooltable": [{"number": 2}]}}, True),
+        ({"mill": {"depth": -2.0}}, True),
+    ),
+)
+def test_merge_setup(data, expected):
+    setup = {
+        "view": {"color": (0.5, 0.5, 0.5), "grid": 10},
+        "mill": {"depth": -1.0, "tooltable": [{"number": 1}]},
+    }
+    assert calc.merge_setup(setup, data) == expected
+    for sname, section in data.items():
+        for key, value in section.items():
+            assert setup[sname][key] == value
+    # loading the same data again changes nothing
+    assert not calc.merge_setup(setup, data)
+
+
+@pytest.mark.parametrize(
+    "data",
+    (
+        {"type": "LINE", "start": (0.0, 0.0), "end": (10.0, 0.0)},
+        {"type": "ARC", "start": (1.0, 2.0), "end": (3.0, 4.0), "bulge": 0.5},
+    ),
+)
+def test_segment_copy(data):
+    segment = VcSegment(data)
+    result = segment.copy()
+    assert result is not segment
+    assert result.dump() == segment.dump()
+    result.bulge = -1.0
+    assert segment.bulge == data.get("bulge", 0.0)
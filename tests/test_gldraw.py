@@ -0,0 +1,265 @@
+import numpy as np
+import pytest
+
+from viaconstructor import gldraw
+from viaconstructor.vc_types import VcObject, VcSegment
+
+
+@pytest.mark.parametrize(
+    "circles, expected_len, expected_first",
+    (
+        ([], 0, None),
+        (
+            [(10.0, 20.0, -1.0, 2.0)],
+            36,
+            [[10.0, 20.0, -1.0], [10.0, 18.0, -1.0], [11.0, 18.268, -1.0]],
+        ),
+        (
+            [(10.0, 20.0, -1.0, 2.0), (0.0, 0.0, -2.0, 1.0)],
+            72,
+            [[10.0, 20.0, -1.0], [10.0, 18.0, -1.0], [11.0, 18.268, -1.0]],
+        ),
+    ),
+)
+def test_circle_triangles(circles, expected_len, expected_first):
+    result = gldraw.circle_triangles(circles)
+    assert len(result) == expected_len
+    if expected_first:
+        assert result[:3].round(3).tolist() == expected_first
+
+
+@pytest.mark.parametrize(
+    "segments, depth, interpolate, expected",
+    (
+        (
+            [
+                VcSegment({"start": (0.0, 0.0), "end": (10.0, 0.0), "bulge": 0.0}),
+            ],
+            -2.0,
+            True,
+            [
+                (0.0, 0.0, 0.0),
+                (0.0, 0.0, -2.0),
+                (0.0, 0.0, 0.0),
+                (10.0, 0.0, 0.0),
+                (0.0, 0.0, -2.0),
+                (10.0, 0.0, -2.0),
+            ],
+        ),
+        (
+            [
+                VcSegment({"start": (0.0, 0.0), "end": (10.0, 0.0), "bulge": 1.0}),
+            ],
+            -2.0,
+            False,
+            [
+                (0.0, 0.0, 0.0),
+                (0.0, 0.0, -2.0),
+                (0.0, 0.0, 0.0),
+                (10.0, 0.0, 0.0),
+                (0.0, 0.0, -2.0),
+                (10.0, 0.0, -2.0),
+            ],
+        ),
+    ),
+)
+def test_object_edge_vertices(segments, depth, interpolate, expected):
+    obj = VcObject({"segments": segments})
+    assert gldraw.object_edge_vertices(obj, depth, interpolate) == expected
+
+
+@pytest.mark.parametrize(
+    "text, scale, center_x, center_y",
+    (
+        ("12", 1.0, False, False),
+        ("12", 0.5, True, False),
+        ("#3", 0.4, False, True),
+    ),
+)
+def test_text_vertices(text, scale, center_x, center_y):
+    lines, width, height = gldraw.text_lines(text)
+    result = gldraw.text_vertices(text, 10.0, 20.0, -1.0, scale, center_x, center_y)
+    assert len(result) == len(lines) * 2
+    (x_1, y_1), (_x_2, _y_2) = lines[0]
+    pos_x = 10.0 - width * scale / 2.0 if center_x else 10.0
+    pos_y = 20.0 - height * scale / 2.0 if center_y else 20.0
+    assert result[0] == (pos_x + x_1 * scale, pos_y + y_1 * scale, -1.0)
+
+
+def test_object_edge_vertices_arc():
+    segment = VcSegment({"start": (0.0, 0.0), "end": (10.0, 0.0), "bulge": 1.0})
+    obj = VcObject({"segments": [segment]})
+    result = gldraw.object_edge_vertices(obj, -2.0, True)
+    points = len(gldraw.bulge_points(segment))
+    middle = 2 + (points + 1) * 2
+    top = result[2:middle]
+    bottom = result[middle:]
+    assert len(top) == len(bottom) == (points + 1) * 2
+    assert [(x, y) for x, y, _z in top] == [(x, y) for x, y, _z in bottom]
+    assert top[-1] == (10.0, 0.0, 0.0)
+    assert bottom[-1] == (10.0, 0.0, -2.0)
+
+
+@pytest.mark.parametrize(
+    "start, end, other_start, other_end",
+    (
+        ((0.0, 0.0), (1.0, 0.0), (-0.0, -0.0), (1.0, -0.0)),
+        ((-0.0, -0.0), (1.0, -0.0), (0.0, 0.0), (1.0, 0.0)),
+    ),
+)
+def test_bulge_points_signed_zero(start, end, other_start, other_end):
+    segment = VcSegment({"start": start, "end": end, "bulge": 1.0})
+    expected = gldraw._bulge_points.__wrapped__(*start, *end, 1.0)
+    # the same points with the other zero sign must not share a cached result
+    gldraw.bulge_points(
+        VcSegment({"start": other_start, "end": other_end, "bulge": 1.0})
+    )
+    assert gldraw.bulge_points(segment) == expected
+
+
+@pytest.mark.parametrize(
+    "contours, expected_len",
+    (
+        ((), 0),
+        (
+            (((0.0, 0.0, 0.0), (10.0, 0.0, 0.0), (10.0, 10.0, 0.0), (0.0, 10.0, 0.0)),),
+            6,
+        ),
+        (
+            (
+                (
+                    (0.0, 0.0, 0.0),
+                    (10.0, 0.0, 0.0),
+                    (10.0, 10.0, 0.0),
+                    (0.0, 10.0, 0.0),
+                ),
+                ((2.0, 2.0, 0.0), (8.0, 2.0, 0.0), (8.0, 8.0, 0.0), (2.0, 8.0, 0.0)),
+            ),
+            24,
+        ),
+    ),
+)
+def test_tessellate(contours, expected_len):
+    result = gldraw.tessellate(contours)
+    assert len(result) == expected_len
+
+
+@pytest.mark.parametrize(
+    "positions, start, end, depth, axis, expected",
+    (
+        ([], 0.0, 10.0, -1.0, 0, []),
+        (
+            [0, 5],
+            -10.0,
+            10.0,
+            -1.0,
+            0,
+            [[0, -10, -1], [0, 10, -1], [5, -10, -1], [5, 10, -1]],
+        ),
+        (
+            [0, 5],
+            -10.0,
+            10.0,
+            -1.0,
+            1,
+            [[-10, 0, -1], [10, 0, -1], [-10, 5, -1], [10, 5, -1]],
+        ),
+    ),
+)
+def test_grid_lines(positions, start, end, depth, axis, expected):
+    result = gldraw.grid_lines(np.array(positions), start, end, depth, axis)
+    assert result.tolist() == expected
+
+
+@pytest.mark.parametrize(
+    "simulation_data, expected_lens, expected_lines",
+    (
+        ([], (0, 0, 0), []),
+        (
+            [((0.0, 0.0, -1.0), (10.0, 0.0, -1.0), 2.0, "full", "")],
+            (2, 6, 6),
+            [
+                [0.0, 0.0, -1.0],
+                [10.0, 0.0, -1.0],
+                [5.0, 0.0, -0.99],
+                [2.0, 1.0, -0.99],
+                [5.0, 0.0, -0.99],
+                [2.0, -1.0, -0.99],
+            ],
+        ),
+        (
+            [((0.0, 0.0, 1.0), (0.0, 4.0, 1.0), 2.0, "full", "OFF")],
+            (0, 0, 6),
+            [
+                [0.0, 0.0, 1.0],
+                [0.0, 4.0, 1.0],
+                [0.0, 0.0, 1.01],
+                [-1.0, -3.0, 1.01],
+                [0.0, 0.0, 1.01],
+                [1.0, -3.0, 1.01],
+            ],
+        ),
+        (
+            [((0.0, 0.0, -1.0), (10.0, 0.0, -1.0), 2.0, "minimal", "")],
+            (0, 0, 2),
+            [[0.0, 0.0, -1.0], [10.0, 0.0, -1.0]],
+        ),
+        (
+            [
+                ((0.0, 0.0, -1.0), (10.0, 0.0, -1.0), 2.0, "minimal", ""),
+                ((10.0, 0.0, -1.0), (10.0, 0.0, -1.0), 2.0, "minimal", ""),
+            ],
+            (0, 0, 2),
+            [[0.0, 0.0, -1.0], [10.0, 0.0, -1.0]],
+        ),
+        (
+            [
+                ((0.0, 0.0, 1.0), (0.0, 0.0, -1.0), 2.0, "full", ""),
+                ((0.0, 0.0, -1.0), (0.0, 0.0, -1.0), 2.0, "full", ""),
+                ((0.0, 0.0, -1.0), (0.0, 0.0, -1.0), 2.0, "full", ""),
+            ],
+            (2, 6, 4),
+            [
+                [0.0, 0.0, 1.0],
+                [0.0, 0.0, -1.0],
+                [0.0, 0.0, -1.0],
+                [0.0, 0.0, -1.0],
+            ],
+        ),
+    ),
+)
+def test_mill_lines(simulation_data, expected_lens, expected_lines):
+    result = gldraw.mill_lines(simulation_data)
+    assert (
+        len(result["circles"]),
+        len(result["fills"]),
+        len(result["lines"]),
+    ) == expected_lens
+    assert len(result["colors"]) == len(result["lines"])
+    assert result["colors"].dtype == np.uint8
+    assert result["lines"].round(6).tolist() == expected_lines
+
+
+@pytest.mark.parametrize(
+    "pos, radius, height",
+    (
+        ((0.0, 0.0, 0.0), 1.0, 5.0),
+        ((10.0, -5.0, -2.0), 1.5, 7.0),
+    ),
+)
+def test_tool_vertices(pos, radius, height):
+    result = gldraw.tool_vertices(pos, radius, height)
+    assert len(result) == 26
+    assert result[0].tolist() == [pos[0] + radius, pos[1], pos[2] + height]
+    assert result[1].tolist() == [pos[0] + radius, pos[1], pos[2]]
+    assert result[-2].tolist() == [pos[0] + radius, pos[1], pos[2] + height]
+    assert result[6].round(6).tolist() == [pos[0], pos[1] + radius, pos[2] + height]
+
+
+def test_cross_vertices():
+    assert gldraw.cross_vertices(10.0, 20.0, 0.1) == (
+        (9.0, 19.0, 0.1),
+        (11.0, 21.0, 0.1),
+        (9.0, 21.0, 0.1),
+        (11.0, 19.0, 0.1),
+    )
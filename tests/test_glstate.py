@@ -0,0 +1,25 @@
+import pytest
+
+from viaconstructor import glstate
+
+
+@pytest.mark.parametrize(
+    "colors, expected",
+    (
+        ([(1.0, 0.0, 0.0)], 1),
+        ([(1.0, 0.0, 0.0), (1.0, 0.0, 0.0)], 1),
+        ([(1.0, 0.0, 0.0), (1.0, 0.0, 0.0, 1.0)], 1),
+        ([(1.0, 0.0, 0.0), (1.0, 0.0, 0.0, 0.5)], 2),
+        ([(1.0, 0.0, 0.0), (0.0, 1.0, 0.0), (1.0, 0.0, 0.0)], 3),
+    ),
+)
+def test_set_color(monkeypatch, colors, expected):
+    calls = []
+    monkeypatch.setattr(glstate.GL, "glColor4f", lambda *args: calls.append(args))
+    glstate.reset_state()
+    for color in colors:
+        glstate.set_color(*color)
+    assert len(calls) == expected
+    glstate.reset_state()
+    glstate.set_color(*colors[-1])
+    assert len(calls) == expected + 1
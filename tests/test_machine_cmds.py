@@ -249,3 +249,154 @@ def test_polylines2machine_cmd(project, expected):
     result = machine_cmd.polylines2machine_cmd(project, PostProcessorGcodeLinuxCNC())
     print(result)
     assert result == expected
+
+
+@pytest.mark.parametrize(
+    "lead_out, retracts",
+    (
+        ("straight", 3),
+        ("off", 2),
+    ),
+)
+def test_polylines2machine_cmd_same_start(lead_out, retracts):
+    mill = {
+        "G64": 0.05,
+        "active": True,
+        "back_home": True,
+        "depth": -4.0,
+        "fast_move_z": 20.0,
+        "pocket": False,
+        "reverse": False,
+        "step": -4.0,
+        "helix_mode": False,
+    }
+    offsets = {}
+    # two closed objects with the same start point
+    for offset_num in ("0.0", "1.0"):
+        offset = fakeOffset(
+            ([0.0, 10.0, 10.0, 0.0], [0.0, 0.0, 10.0, 10.0], [0.0, 0.0, 0.0, 0.0]),
+            True,
+            0,
+            mill,
+            "outside",
+        )
+        offset.start = (0.0, 0.0)
+        offset.setup["leads"] = {"in": "off", "out": lead_out, "out_lenght": 5.0}
+        offsets[offset_num] = offset
+    project = {
+        "filename_draw": "/tmp/t.dxf",
+        "filename_machine_cmd": "/tmp/t.ngc",
+        "axis": ["X", "Y", "Z"],
+        "offsets": offsets,
+        "maxOuter": 0,
+        "minMax": (0.0, 0.0, 10.0, 10.0),
+        "setup": {
+            "workpiece": {
+                "zero": "bottomLeft",
+                "offset_x": 0.0,
+                "offset_y": 0.0,
+                "offset_z": 0.0,
+            },
+            "tool": {
+                "diameter": 4.0,
+                "number": 1,
+                "speed": 10000,
+                "pause": 1,
+                "rate_h": 10000,
+                "rate_v": 1000,
+            },
+            "mill": mill,
+            "machine": {
+                "mode": "mill",
+                "unit": "mm",
+                "comments": False,
+                "g54": False,
+            },
+        },
+    }
+    result = machine_cmd.polylines2machine_cmd(project, PostProcessorGcodeLinuxCNC())
+    # the tool only stays down when the last object ended on the start point
+    assert result.count("G00 Z20.000000") == retracts
+    # no rapid xy move while the tool is below the surface
+    pos_z = 0.0
+    for line in result.split("\n"):
+        words = line.split("(")[0].split()
+        for word in words:
+            if word.startswith("Z"):
+                pos_z = float(word[1:])
+        if words and words[0] == "G00" and any(word[0] in "XY" for word in words):
+            assert pos_z > 0.0, line
+
+
+@pytest.mark.parametrize(
+    "unit, offsets, expected",
+    (
+        (
+            "mm",
+            (0.0, 0.0, 0.0),
+            [
+                "G00 X1.000000 Y2.000000 Z5.000000",
+                "G01 Z-1.000000",
+                "G01 X10.500000",
+                "G02 X11.000000 Y2.500000 I0.500000 J0.000000",
+                "G03 X10.500000 Y2.000000 I-0.500000 J0.000000",
+            ],
+        ),
+        (
+            "inch",
+            (1.0, 0.0, 0.0),
+            [
+                "G00 X1.039370 Y0.078740 Z0.196850",
+                "G01 Z-0.039370",
+                "G01 X1.413386",
+                "G02 X1.433071 Y0.098425 I0.500000 J0.000000",
+                "G03 X1.413386 Y0.078740 I-0.500000 J0.000000",
+            ],
+        ),
+    ),
+)
+def test_gcode_linuxcnc_moves(unit, offsets, expected):
+    post = PostProcessorGcodeLinuxCNC(comments=False)
+    post.unit(unit)
+    post.machine_offsets(offsets)
+    post.gcode = []
+    post.move(x_pos=1.0, y_pos=2.0, z_pos=5.0)
+    post.linear(x_pos=1.0, y_pos=2.0, z_pos=-1.0)
+    post.linear(x_pos=10.5)
+    post.arc_cw(x_pos=11.0, y_pos=2.5, i_pos=0.5, j_pos=0.0)
+    post.arc_ccw(x_pos=10.5, y_pos=2.0, i_pos=-0.5, j_pos=0.0)
+    assert post.gcode == expected
+
+
+def test_gcode_linuxcnc_axis_cache():
+    post = PostProcessorGcodeLinuxCNC(comments=False)
+    post.linear(x_pos=25.4, y_pos=0.0, z_pos=-0.0)
+    post.unit("inch")
+    post.gcode = []
+    post.linear(x_pos=0.0, y_pos=25.4)
+    post.linear(x_pos=25.4)
+    assert post.gcode == ["G01 X0.000000 Y1.000000", "G01 X1.000000"]
+
+
+@pytest.mark.parametrize(
+    "moves, expected",
+    (
+        (
+            [(1.0, 2.0), (1.0000000001, 3.0)],
+            ["G01 X1.000000 Y2.000000", "G01 Y3.000000"],
+        ),
+        (
+            [(1.0, 2.0), (1.0000000001, 2.0000000001)],
+            ["G01 X1.000000 Y2.000000"],
+        ),
+        (
+            [(1.0, 2.0), (1.000001, 2.0)],
+            ["G01 X1.000000 Y2.000000", "G01 X1.000001"],
+        ),
+    ),
+)
+def test_gcode_linuxcnc_same_values(moves, expected):
+    post = PostProcessorGcodeLinuxCNC(comments=False)
+    for x_pos, y_pos in moves:
+        post.linear(x_pos=x_pos, y_pos=y_pos)
+    assert post.gcode == expected
@@ -1,10 +1,13 @@
 """viaconstructor calculation functions."""
 
+import json
 import math
 from copy import deepcopy
+from functools import lru_cache
 
-import ezdxf
+import numpy as np
 import pyclipper
+from ezdxf.math import arc_to_bulge
 
 from .ext.cavaliercontours import cavaliercontours as cavc
 from .vc_types import VcObject
@@ -15,50 +18,66 @@ TWO_PI = math.pi * 2
 # ########## Misc Functions ###########
 def rotate_list(rlist, idx):
     """rotating a list of values."""
-    return rlist[idx:] + rlist[:idx]
+    rotated = rlist[idx:]
+    rotated += rlist[:idx]
+    return rotated
+
+
+def copy_setup(data):
+    """copies a setup tree of dicts, lists and immutable values, faster than deepcopy."""
+    if isinstance(data, dict):
+        return {key: copy_setup(value) for key, value in data.items()}
+    if isinstance(data, list):
+        return [copy_setup(value) for value in data]
+    return data
+
+
+def merge_setup(setup, data):
+    """updates the setup sections with loaded json data, True if a value has changed."""
+    # json has no tuples, compare against the values as they would be saved
+    current = json.loads(json.dumps(setup))
+    changed = False
+    for sname, section in setup.items():
+        section_data = data.get(sname, {})
+        if not changed:
+            changed = any(
+                current[sname].get(key) != value for key, value in section_data.items()
+            )
+        section.update(section_data)
+    return changed
 
 
 # ########## Line Functions ###########
-def get_next_line(end_point, lines):
-    selected = -1
-    nearest = 1000000
-    reverse = 0
-    for idx, line in enumerate(lines):
-        dist = calc_distance(end_point, line[0])
-        if dist < nearest:
-            selected = idx
-            nearest = dist
-            reverse = 0
-
-        dist = calc_distance(end_point, line[1])
-        if dist < nearest:
-            selected = idx
-            nearest = dist
-            reverse = 1
-
-    if selected != -1:
-        line = lines.pop(selected)
-        if reverse:
-            line = (line[1], line[0])
-        return (nearest, line)
-    return None
-
-
 def lines_to_path(lines, max_vdist, max_dist):
     # optimize / adding bridges
-    lines = lines[0:]
     output_lines = []
     if not lines:
         return []
 
-    last_line = lines.pop(0)
+    # (N, 2, 2) array of start/end points, ties go to the first line and its start
+    line_points = np.array(
+        [(line[0][0], line[0][1], line[1][0], line[1][1]) for line in lines],
+        dtype=np.float64,
+    ).reshape((-1, 2, 2))
+    used = np.zeros(len(lines), dtype=bool)
+    used[0] = True
+    last_line = lines[0]
     output_lines.append((last_line[0], last_line[1]))
-    while True:
-        check = get_next_line(last_line[1], lines)
-        if check is None:
+    for _num in range(len(lines) - 1):
+        dists = np.hypot(
+            line_points[:, :, 0] - last_line[1][0],
+            line_points[:, :, 1] - last_line[1][1],
+        )
+        dists[used] = np.inf
+        nearest = int(np.argmin(dists))
+        dist = float(dists.flat[nearest])
+        if dist >= 1000000:
             break
-        dist = check[0]
-        next_line = check[1]
+        (line_num, reverse) = divmod(nearest, 2)
+        used[line_num] = True
+        next_line = lines[line_num]
+        if reverse:
+            next_line = (next_line[1], next_line[0])
         vdist = abs(last_line[0][1] - next_line[0][1])
         if vdist <= max_vdist:
             if dist <= max_dist:
@@ -103,7 +122,7 @@ def angle_of_line(p_1, p_2):
 
 def fuzy_match(p_1, p_2, max_distance=0.01):
     """checks if  two points are matching / rounded."""
-    return calc_distance(p_1, p_2) < max_distance
+    return math.hypot(p_1[0] - p_2[0], p_1[1] - p_2[1]) < max_distance
 
 
 def calc_distance(p_1, p_2):
@@ -118,9 +137,9 @@ def calc_distance3d(p_1, p_2):
 
 def is_between(p_1, p_2, p_3):
     """checks if a point is between 2 other points."""
-    return round(calc_distance(p_1, p_3), 2) + round(
-        calc_distance(p_1, p_2), 2
-    ) == round(calc_distance(p_2, p_3), 2)
+    return round(math.hypot(p_1[0] - p_3[0], p_1[1] - p_3[1]), 2) + round(
+        math.hypot(p_1[0] - p_2[0], p_1[1] - p_2[1]), 2
+    ) == round(math.hypot(p_2[0] - p_3[0], p_2[1] - p_3[1]), 2)
 
 
 def line_center_2d(p_1, p_2):
@@ -140,7 +159,7 @@ def line_center_3d(p_1, p_2):
 
 def calc_face(p_1, p_2):
     """gets the face og a line in 2D."""
-    angle = angle_of_line(p_1, p_2) + math.pi
+    angle = math.atan2(p_2[1] - p_1[1], p_2[0] - p_1[0]) + math.pi
     center_x = (p_1[0] + p_2[0]) / 2
     center_y = (p_1[1] + p_2[1]) / 2
     bcenter_x = center_x - 0.01 * math.sin(angle)
@@ -148,18 +167,6 @@ def calc_face(p_1, p_2):
     return (bcenter_x, bcenter_y)
 
 
-def angle_2d(p_1, p_2):
-    """gets the angle of a single line (2nd version)."""
-    theta1 = math.atan2(p_1[1], p_1[0])
-    theta2 = math.atan2(p_2[1], p_2[0])
-    dtheta = theta2 - theta1
-    while dtheta > math.pi:
-        dtheta -= TWO_PI
-    while dtheta < -math.pi:
-        dtheta += TWO_PI
-    return dtheta
-
-
 def quadratic_bezier(curv_pos, points):
     curve_x = (1 - curv_pos) * (
         (1 - curv_pos) * points[0][0] + curv_pos * points[1][0]
@@ -185,6 +192,15 @@ def point_of_line3d(p_1, p_2, line_pos):
     ]
 
 
+def path_distances(points, closed=False):
+    """gets the accumulated distances along a list of points in 2D."""
+    point_array = np.asarray(points, dtype=np.float64)[:, :2]
+    if closed:
+        point_array = np.vstack((point_array, point_array[:1]))
+    diff = np.diff(point_array, axis=0)
+    return np.concatenate(((0.0,), np.cumsum(np.hypot(diff[:, 0], diff[:, 1]))))
+
+
 def points_to_boundingbox(points):
     min_x = points[0][0]
     min_y = points[0][1]
@@ -201,17 +217,43 @@ def points_to_boundingbox(points):
 # ########## Object & Segments Functions ###########
 
 
+@lru_cache(maxsize=4096)
+def _bulge_to_arc(start_x, start_y, end_x, end_y, bulge):
+    # same operations as ezdxf.math.bulge_to_arc(), without the Vec2 objects
+    radius = math.hypot(start_x - end_x, start_y - end_y) * (1.0 + (bulge * bulge))
+    radius = radius / 4.0 / bulge
+    angle = math.atan2(end_y - start_y, end_x - start_x) + (
+        math.pi / 2 - math.atan(bulge) * 2
+    )
+    center_x = start_x + math.cos(angle) * radius
+    center_y = start_y + math.sin(angle) * radius
+    start_angle = math.atan2(start_y - center_y, start_x - center_x)
+    end_angle = math.atan2(end_y - center_y, end_x - center_x)
+    if bulge < 0:
+        return ((center_x, center_y), end_angle, start_angle, abs(radius))
+    return ((center_x, center_y), start_angle, end_angle, abs(radius))
+
+
+def bulge_to_arc(start, end, bulge):
+    """cached version of ezdxf.math.bulge_to_arc(), center as tuple."""
+    args = (start[0], start[1], end[0], end[1], bulge)
+    # 0.0 and -0.0 share a cache key but may give different angles
+    if 0.0 in args:
+        return _bulge_to_arc.__wrapped__(*args)
+    return _bulge_to_arc(*args)
+
+
 def get_half_bulge_point(last: tuple, point: tuple, bulge: float) -> tuple:
     (
         center,
         start_angle,  # pylint: disable=W0612
         end_angle,  # pylint: disable=W0612
         radius,  # pylint: disable=W0612
-    ) = ezdxf.math.bulge_to_arc(last, point, bulge)
+    ) = bulge_to_arc(last, point, bulge)
     while start_angle > end_angle:
         start_angle -= math.pi
     half_angle = start_angle + (end_angle - start_angle) / 2
-    (start, end, bulge) = ezdxf.math.arc_to_bulge(  # pylint: disable=W0612
+    (start, end, bulge) = arc_to_bulge(  # pylint: disable=W0612
         center,
         start_angle,
         half_angle,
@@ -224,27 +266,49 @@ def clean_segments(segments: list) -> list:
     """removing double and overlaying lines."""
     cleaned = {}
     for segment1 in segments:
-        min_x = round(min(segment1.start[0], segment1.end[0]), 4)
-        min_y = round(min(segment1.start[1], segment1.end[1]), 4)
-        max_x = round(max(segment1.start[0], segment1.end[0]), 4)
-        max_y = round(max(segment1.start[1], segment1.end[1]), 4)
-        bulge = round(segment1.bulge, 4) or 0.0
-        key = f"{min_x},{min_y},{max_x},{max_y},{bulge},{segment1.layer}"
+        (start_x, start_y) = segment1.start[:2]
+        (end_x, end_y) = segment1.end[:2]
+        key = (
+            round(min(start_x, end_x), 4),
+            round(min(start_y, end_y), 4),
+            round(max(start_x, end_x), 4),
+            round(max(start_y, end_y), 4),
+            round(segment1.bulge, 4) or 0.0,
+            segment1.layer,
+        )
         cleaned[key] = segment1
     return list(cleaned.values())
 
 
-def is_inside_polygon(obj, point):
+def angle_sum(starts, ends, point):
+    """gets the summed angles of (N, 2) arrays of lines seen from a point."""
+    theta1 = np.arctan2(starts[:, 1] - point[1], starts[:, 0] - point[0])
+    theta2 = np.arctan2(ends[:, 1] - point[1], ends[:, 0] - point[0])
+    dtheta = theta2 - theta1
+    dtheta[dtheta > math.pi] -= TWO_PI
+    dtheta[dtheta < -math.pi] += TWO_PI
+    return float(dtheta.sum())
+
+
+def segments2arrays(segments):
+    """gets the start points, end points and bulges of segments as numpy arrays."""
+    starts = np.array(
+        [(segment.start[0], segment.start[1]) for segment in segments],
+        dtype=np.float64,
+    ).reshape(-1, 2)
+    ends = np.array(
+        [(segment.end[0], segment.end[1]) for segment in segments],
+        dtype=np.float64,
+    ).reshape(-1, 2)
+    bulges = np.array([segment.bulge for segment in segments], dtype=np.float64)
+    return (starts, ends, bulges)
+
+
+def is_inside_polygon(obj, point, arrays=None):
     """checks if a point is inside an polygon."""
-    angle = 0.0
-    p_1 = [0, 0]
-    p_2 = [0, 0]
-    for segment in obj.segments:
-        p_1[0] = segment.start[0] - point[0]
-        p_1[1] = segment.start[1] - point[1]
-        p_2[0] = segment.end[0] - point[0]
-        p_2[1] = segment.end[1] - point[1]
-        angle += angle_2d(p_1, p_2)
+    if arrays is None:
+        arrays = segments2arrays(obj.segments)
+    angle = angle_sum(arrays[0], arrays[1], point)
     return bool(abs(angle) >= math.pi)
 
 
@@ -260,14 +324,46 @@ def reverse_object(obj):
 
 
 # ########## Objects Functions ###########
-def find_outer_objects(objects, point, exclude=None):
+def objects2boundingboxes(objects):
+    """gets the indexes, (N, 4) bounding boxes and segment arrays of closed objects"""
+    obj_idxs = []
+    boxes = []
+    arrays = []
+    for obj_idx, obj in objects.items():
+        if obj.closed and obj.segments:
+            (starts, ends, bulges) = segments2arrays(obj.segments)
+            obj_idxs.append(obj_idx)
+            boxes.append(
+                (
+                    min(starts[:, 0].min(), ends[:, 0].min()),
+                    min(starts[:, 1].min(), ends[:, 1].min()),
+                    max(starts[:, 0].max(), ends[:, 0].max()),
+                    max(starts[:, 1].max(), ends[:, 1].max()),
+                )
+            )
+            arrays.append((starts, ends, bulges))
+    return (obj_idxs, np.array(boxes, dtype=np.float64).reshape(-1, 4), arrays)
+
+
+def find_outer_objects(objects, point, exclude=None, boundingboxes=None):
     """gets a list of closed objects where the point is inside."""
     if not exclude:
         exclude = []
+    if boundingboxes is None:
+        boundingboxes = objects2boundingboxes(objects)
+    obj_idxs, boxes, arrays = boundingboxes
+    # only objects with the point inside their bounding box can contain it
+    candidates = np.flatnonzero(
+        (boxes[:, 0] <= point[0])
+        & (boxes[:, 1] <= point[1])
+        & (boxes[:, 2] >= point[0])
+        & (boxes[:, 3] >= point[1])
+    )
     outer = []
-    for obj_idx, obj in objects.items():
-        if obj.closed and obj_idx not in exclude:
-            inside = is_inside_polygon(obj, point)
+    for num in candidates:
+        obj_idx = obj_idxs[num]
+        if obj_idx not in exclude:
+            inside = is_inside_polygon(objects[obj_idx], point, arrays[num])
             if inside:
                 outer.append(obj_idx)
     return outer
@@ -276,8 +372,11 @@ def find_outer_objects(objects, point, exclude=None):
 def find_tool_offsets(objects):
     """check if object is inside an other closed  objects."""
     max_outer = 0
+    boundingboxes = objects2boundingboxes(objects)
     for obj_idx, obj in objects.items():
-        outer = find_outer_objects(objects, obj.segments[0].start, [obj_idx])
+        outer = find_outer_objects(
+            objects, obj.segments[0].start, [obj_idx], boundingboxes
+        )
         obj.outer_objects = outer
         if obj.closed:
 
@@ -298,7 +397,7 @@ def find_tool_offsets(objects):
 
 def segments2objects(segments):
     """merge single segments to objects."""
-    test_segments = deepcopy(segments)
+    test_segments = [segment.copy() for segment in segments]
     objects = {}
     obj_idx = 0
     max_distance = 0.01
@@ -403,34 +502,69 @@ def vertex_data_cache(offset):
     return vertex_data
 
 
+def start_point_cache(offset):
+    """Caching the vertex next to the start point of an offset."""
+    if hasattr(offset, "start_cache"):
+        return offset.start_cache
+    start_point = found_next_offset_point((offset.start[0], offset.start[1]), offset)
+    offset.start_cache = start_point
+    return start_point
+
+
+def vertex_array_cache(offset):
+    """Caching the vertex points of an offset as (N, 2) numpy array."""
+    if hasattr(offset, "array_cache"):
+        return offset.array_cache
+    vertex_data = vertex_data_cache(offset)
+    points = np.empty((len(vertex_data[0]), 2), dtype=np.float64)
+    points[:, 0] = vertex_data[0]
+    points[:, 1] = vertex_data[1]
+    offset.array_cache = points
+    return points
+
+
+def lines_box_cache(offset):
+    """Caching the (N, 2) line starts / ends and the bounding box of an offset."""
+    if hasattr(offset, "lines_cache"):
+        return offset.lines_cache
+    points = vertex_array_cache(offset)
+    # line num ends at point num and starts at the point before (wrapping if closed)
+    first = 0 if offset.is_closed() else 1
+    starts = np.roll(points, 1, axis=0)[first:]
+    ends = points[first:]
+    if len(points) == 0:
+        box = None
+    else:
+        box = (*points.min(axis=0), *points.max(axis=0))
+    offset.lines_cache = (first, starts, ends, box)
+    return offset.lines_cache
+
+
+def nearest_point_num(mpos, points):
+    """gets the index and distance of the nearest point in a (N, 2) array."""
+    dists = np.hypot(points[:, 0] - mpos[0], points[:, 1] - mpos[1])
+    point_num = int(np.argmin(dists))
+    return (point_num, float(dists[point_num]))
+
+
 def inside_vertex(vertex_data, point):
     """checks if a point is inside an polygon in vertex format."""
-    angle = 0.0
-    p_1 = [0, 0]
-    p_2 = [0, 0]
-    start_x = vertex_data[0][-1]
-    start_y = vertex_data[1][-1]
-    for end_x, end_y in zip(vertex_data[0], vertex_data[1]):
-        p_1[0] = start_x - point[0]
-        p_1[1] = start_y - point[1]
-        p_2[0] = end_x - point[0]
-        p_2[1] = end_y - point[1]
-        start_x = end_x
-        start_y = end_y
-        angle += angle_2d(p_1, p_2)
+    ends = np.empty((len(vertex_data[0]), 2), dtype=np.float64)
+    ends[:, 0] = vertex_data[0]
+    ends[:, 1] = vertex_data[1]
+    starts = np.roll(ends, 1, axis=0)
+    angle = angle_sum(starts, ends, point)
     return bool(abs(angle) >= math.pi)
 
 
 def vertex2points(vertex_data, no_bulge=False, scale=1.0):
     """converts an vertex to a list of points"""
-    points = []
     if no_bulge:
-        for pos_x, pos_y in zip(vertex_data[0], vertex_data[1]):
-            points.append((pos_x * scale, pos_y * scale))
-    else:
-        for pos_x, pos_y, bulge in zip(vertex_data[0], vertex_data[1], vertex_data[2]):
-            points.append((pos_x * scale, pos_y * scale, bulge))
-    return points
+        points = np.column_stack((vertex_data[0], vertex_data[1])) * scale
+        return list(map(tuple, points.tolist()))
+    points = np.column_stack((vertex_data[0], vertex_data[1], vertex_data[2]))
+    points[:, 0:2] *= scale
+    return list(map(tuple, points.tolist()))
 
 
 def points2vertex(points, scale=1.0):
@@ -477,30 +611,58 @@ def object2vertex(obj):
 # ########## Polyline Functions ###########
 
 
-def found_next_point_on_segment(mpos, objects):
-    for obj_idx, obj in objects.items():
-        for segment_idx, segment in enumerate(obj.segments):
-            last_x = segment.start[0]
-            last_y = segment.start[1]
-            pos_x = segment.end[0]
-            pos_y = segment.end[1]
-            bulge = segment.bulge
-            for check in (
-                ((mpos[0] - 5, mpos[1] - 5), (mpos[0] + 5, mpos[1] + 5)),
-                ((mpos[0] + 5, mpos[1] - 5), (mpos[0] - 5, mpos[1] + 5)),
-                # ((mpos[0] - 5, mpos[1]), (mpos[0] + 5, mpos[1])),
-            ):
-                inter = lines_intersect(check[0], check[1], segment.start, segment.end)
-                if inter:
-                    length = calc_distance(segment.start, segment.end)
-                    if length > 0.0:
-                        if bulge != 0.0:
+def lines_intersect_mask(line_start, line_end, starts, ends):
+    """checks a line against (N, 2) arrays of line starts and ends, like lines_intersect()."""
+    x_1, y_1 = line_start
+    x_2, y_2 = line_end
+    x_3 = starts[:, 0]
+    y_3 = starts[:, 1]
+    x_4 = ends[:, 0]
+    y_4 = ends[:, 1]
+    denom = (y_4 - y_3) * (x_2 - x_1) - (x_4 - x_3) * (y_2 - y_1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        u_a = ((x_4 - x_3) * (y_1 - y_3) - (y_4 - y_3) * (x_1 - x_3)) / denom
+        u_b = ((x_2 - x_1) * (y_1 - y_3) - (y_2 - y_1) * (x_1 - x_3)) / denom
+    return (denom != 0) & (u_a >= 0) & (u_a <= 1) & (u_b >= 0) & (u_b <= 1)
 
-                            inter = get_half_bulge_point(
-                                (last_x, last_y), (pos_x, pos_y), bulge
-                            )
 
-                        return (obj_idx, segment_idx, inter)
+def found_next_point_on_segment(mpos, objects):
+    segments = [
+        (obj_idx, segment_idx, segment)
+        for obj_idx, obj in objects.items()
+        for segment_idx, segment in enumerate(obj.segments)
+    ]
+    (starts, ends, _bulges) = segments2arrays(
+        [segment for _obj_idx, _segment_idx, segment in segments]
+    )
+    checks = (
+        ((mpos[0] - 5, mpos[1] - 5), (mpos[0] + 5, mpos[1] + 5)),
+        ((mpos[0] + 5, mpos[1] - 5), (mpos[0] - 5, mpos[1] + 5)),
+        # ((mpos[0] - 5, mpos[1]), (mpos[0] + 5, mpos[1])),
+    )
+    hits = np.zeros(len(segments), dtype=bool)
+    for check in checks:
+        hits |= lines_intersect_mask(check[0], check[1], starts, ends)
+    # the vectorized test only preselects, the exact checks run on the hits
+    for num in np.flatnonzero(hits):
+        obj_idx, segment_idx, segment = segments[num]
+        last_x = segment.start[0]
+        last_y = segment.start[1]
+        pos_x = segment.end[0]
+        pos_y = segment.end[1]
+        bulge = segment.bulge
+        for check in checks:
+            inter = lines_intersect(check[0], check[1], segment.start, segment.end)
+            if inter:
+                length = calc_distance(segment.start, segment.end)
+                if length > 0.0:
+                    if bulge != 0.0:
+
+                        inter = get_half_bulge_point(
+                            (last_x, last_y), (pos_x, pos_y), bulge
+                        )
+
+                    return (obj_idx, segment_idx, inter)
     return ()
 
 
@@ -548,61 +710,95 @@ def found_next_open_segment_point(mpos, objects, max_dist=None, exclude=None):
     return nearest
 
 
-def found_next_offset_point(mpos, offset):
+def found_next_open_segment_points(mpos, objects, max_dist=None):
+    """gets the nearest open segment end and the nearest other one within max_dist."""
+    ends = []
     nearest = ()
     min_dist = None
-    vertex_data = vertex_data_cache(offset)
-    point_num = 0
-    for pos_x, pos_y in zip(vertex_data[0], vertex_data[1]):
-        dist = calc_distance(mpos, (pos_x, pos_y))
+    for obj_idx, obj in objects.items():
+        if not obj.closed:
+            for segmentd_idx in (0, -1):
+                if segmentd_idx == 0:
+                    pos_x = obj.segments[segmentd_idx].start[0]
+                    pos_y = obj.segments[segmentd_idx].start[1]
+                else:
+                    pos_x = obj.segments[segmentd_idx].end[0]
+                    pos_y = obj.segments[segmentd_idx].end[1]
+                dist = calc_distance(mpos, (pos_x, pos_y))
+                ends.append((dist, (pos_x, pos_y, obj_idx, segmentd_idx)))
+                if min_dist is None or dist < min_dist:
+                    min_dist = dist
+                    nearest = (pos_x, pos_y, obj_idx, segmentd_idx)
+    if not nearest:
+        return ((), ())
+    second = ()
+    min_dist = None
+    for dist, end in ends:
+        if end[2:] == nearest[2:]:
+            continue
+        if max_dist and dist > max_dist:
+            continue
         if min_dist is None or dist < min_dist:
             min_dist = dist
-            nearest = (pos_x, pos_y, point_num)
-        point_num += 1
-    return nearest
+            second = end
+    return (nearest, second)
+
+
+def found_next_offset_point(mpos, offset):
+    points = vertex_array_cache(offset)
+    if len(points) == 0:
+        return ()
+    vertex_data = vertex_data_cache(offset)
+    point_num = nearest_point_num(mpos, points)[0]
+    return (vertex_data[0][point_num], vertex_data[1][point_num], point_num)
 
 
 def found_next_tab_point(mpos, offsets):
+    checks = (
+        ((mpos[0] - 5, mpos[1] - 5), (mpos[0] + 5, mpos[1] + 5)),
+        ((mpos[0] + 5, mpos[1] - 5), (mpos[0] - 5, mpos[1] + 5)),
+        ((mpos[0] - 5, mpos[1]), (mpos[0] + 5, mpos[1])),
+    )
     for offset in offsets.values():
-        vertex_data = vertex_data_cache(offset)
-        if offset.is_closed():
-            last_x = vertex_data[0][-1]
-            last_y = vertex_data[1][-1]
-            last_bulge = vertex_data[2][-1]
-        else:
-            last_x = None
-            last_y = None
-            last_bulge = None
-        for pos_x, pos_y, next_bulge in zip(
-            vertex_data[0], vertex_data[1], vertex_data[2]
+        (first, starts, ends, box) = lines_box_cache(offset)
+        # skip offsets far away from the check lines
+        if (
+            box is None
+            or box[0] > mpos[0] + 6
+            or box[2] < mpos[0] - 6
+            or box[1] > mpos[1] + 6
+            or box[3] < mpos[1] - 6
         ):
-            if last_x is not None:
-                line_start = (last_x, last_y)
-                line_end = (pos_x, pos_y)
-                for check in (
-                    ((mpos[0] - 5, mpos[1] - 5), (mpos[0] + 5, mpos[1] + 5)),
-                    ((mpos[0] + 5, mpos[1] - 5), (mpos[0] - 5, mpos[1] + 5)),
-                    ((mpos[0] - 5, mpos[1]), (mpos[0] + 5, mpos[1])),
-                ):
-                    inter = lines_intersect(check[0], check[1], line_start, line_end)
-                    if inter:
-                        length = calc_distance(line_start, line_end)
-                        if length > offset.setup["tabs"]["width"]:
-                            angle = angle_of_line((last_x, last_y), (pos_x, pos_y))
-                            if last_bulge != 0.0:
-                                inter = get_half_bulge_point(
-                                    (last_x, last_y), (pos_x, pos_y), last_bulge
-                                )
-
-                            start_x = inter[0] + 3 * math.sin(angle)
-                            start_y = inter[1] - 3 * math.cos(angle)
-                            end_x = inter[0] - 3 * math.sin(angle)
-                            end_y = inter[1] + 3 * math.cos(angle)
-                            return (start_x, start_y), (end_x, end_y)
+            continue
+        vertex_data = vertex_data_cache(offset)
+        hits = np.zeros(len(ends), dtype=bool)
+        for check in checks:
+            hits |= lines_intersect_mask(check[0], check[1], starts, ends)
+        # the vectorized test only preselects, the exact checks run on the hits
+        for num in np.flatnonzero(hits) + first:
+            last_x = vertex_data[0][num - 1]
+            last_y = vertex_data[1][num - 1]
+            last_bulge = vertex_data[2][num - 1]
+            pos_x = vertex_data[0][num]
+            pos_y = vertex_data[1][num]
+            line_start = (last_x, last_y)
+            line_end = (pos_x, pos_y)
+            for check in checks:
+                inter = lines_intersect(check[0], check[1], line_start, line_end)
+                if inter:
+                    length = calc_distance(line_start, line_end)
+                    if length > offset.setup["tabs"]["width"]:
+                        angle = angle_of_line((last_x, last_y), (pos_x, pos_y))
+                        if last_bulge != 0.0:
+                            inter = get_half_bulge_point(
+                                (last_x, last_y), (pos_x, pos_y), last_bulge
+                            )
 
-            last_x = pos_x
-            last_y = pos_y
-            last_bulge = next_bulge
+                        start_x = inter[0] + 3 * math.sin(angle)
+                        start_y = inter[1] - 3 * math.cos(angle)
+                        end_x = inter[0] - 3 * math.sin(angle)
+                        end_y = inter[1] + 3 * math.cos(angle)
+                        return (start_x, start_y), (end_x, end_y)
     return ()
 
 
@@ -1055,25 +1251,55 @@ def objects2minmax(objects):
     if len(objects.keys()) == 0:
         return (0, 0, 0, 0)
     fist_key = list(objects.keys())[0]
-    min_x = objects[fist_key]["segments"][0].start[0]
-    min_y = objects[fist_key]["segments"][0].start[1]
-    max_x = objects[fist_key]["segments"][0].start[0]
-    max_y = objects[fist_key]["segments"][0].start[1]
-    for obj in objects.values():
-        if obj.layer.startswith("BREAKS:") or obj.layer.startswith("_TABS"):
-            continue
-        for segment in obj.segments:
-            min_x = min(min_x, segment.start[0])
-            min_x = min(min_x, segment.end[0])
-            min_y = min(min_y, segment.start[1])
-            min_y = min(min_y, segment.end[1])
-            max_x = max(max_x, segment.start[0])
-            max_x = max(max_x, segment.end[0])
-            max_y = max(max_y, segment.start[1])
-            max_y = max(max_y, segment.end[1])
+    # same order as a running min/max, so ties keep the first value
+    points = [objects[fist_key]["segments"][0].start] + [
+        point
+        for obj in objects.values()
+        if not (obj.layer.startswith("BREAKS:") or obj.layer.startswith("_TABS"))
+        for segment in obj.segments
+        for point in (segment.start, segment.end)
+    ]
+    pos_x = [point[0] for point in points]
+    pos_y = [point[1] for point in points]
+    return (min(pos_x), min(pos_y), max(pos_x), max(pos_y))
+
+
+def move_minmax(min_max, xoff: float, yoff: float) -> tuple:
+    """gets the min/max values after move_objects()"""
+    return (
+        min_max[0] + xoff,
+        min_max[1] + yoff,
+        min_max[2] + xoff,
+        min_max[3] + yoff,
+    )
+
+
+def mirror_minmax(min_max, vertical: bool = False, horizontal: bool = False) -> tuple:
+    """gets the min/max values after mirror_objects()"""
+    min_x, min_y, max_x, max_y = min_max
+    if vertical:
+        min_x, max_x = (
+            min_max[0] - min_max[2] + min_max[2],
+            min_max[0] - min_max[0] + min_max[2],
+        )
+    if horizontal:
+        min_y, max_y = (
+            min_max[1] - min_max[3] + min_max[3],
+            min_max[1] - min_max[1] + min_max[3],
+        )
     return (min_x, min_y, max_x, max_y)
 
 
+def rotate_minmax(min_max) -> tuple:
+    """gets the min/max values after rotate_objects()"""
+    return (
+        min_max[1],
+        min_max[1] - min_max[2] + min_max[3],
+        min_max[3],
+        min_max[1] - min_max[0] + min_max[3],
+    )
+
+
 def move_objects(objects: dict, xoff: float, yoff: float) -> None:
     """moves an object"""
     for obj in objects.values():
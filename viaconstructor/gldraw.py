@@ -1,9 +1,9 @@
 """OpenGL drawing functions"""
 
 import math
-from typing import Sequence
+from functools import lru_cache
 
-import ezdxf
+import numpy as np
 from OpenGL import GL
 from OpenGL.GLU import (
     GLU_TESS_BEGIN,
@@ -23,8 +23,9 @@ from OpenGL.GLU import (
     gluTessVertex,
 )
 
-from .calc import angle_of_line, calc_distance, line_center_3d
+from .calc import bulge_to_arc
 from .ext.HersheyFonts.HersheyFonts import HersheyFonts
+from .glstate import forget_color, set_color, set_line_width
 from .preview_plugins.gcode import GcodeParser
 from .preview_plugins.hpgl import HpglParser
 
@@ -33,88 +34,203 @@ font.load_default_font()
 font.normalize_rendering(6)
 
 
-def draw_circle(center: Sequence[float], radius: float) -> None:
-    """draws an circle"""
-    GL.glBegin(GL.GL_TRIANGLE_STRIP)
-    GL.glVertex3f(center[0], center[1], center[2])
+def rgba_bytes(color: tuple) -> tuple:
+    """converts a float rgb color into 8bit rgba for color arrays"""
+    return tuple(round(value * 255) for value in color) + (255,)
+
+
+ARROW_COLOR = rgba_bytes((0.62, 0.73, 0.82))
+CUT_COLOR = rgba_bytes((0.91, 0.0, 0.0))
+OFF_COLOR = rgba_bytes((0.11, 0.63, 0.36))
+
+
+def circle_points() -> np.ndarray:
+    """gets the (13, 2) unit circle points used for the tool circles"""
+    points = []
     angle = 0.0
     step = math.pi / 6
     while angle < math.pi * 2 + step:
-        p_x = center[0] + radius * math.sin(angle)
-        p_y = center[1] - radius * math.cos(angle)
-        GL.glVertex3f(p_x, p_y, center[2])
-        GL.glVertex3f(center[0], center[1], center[2])
+        points.append((math.sin(angle), -math.cos(angle)))
         angle += step
-    GL.glEnd()
-
-
-def draw_mill_line(
-    p_from: Sequence[float],
-    p_to: Sequence[float],
-    width: float,
-    mode: str,
-    options: str,
-) -> None:
-    """draws an milling line including direction and width"""
-    line_angle = angle_of_line(p_from, p_to)
-    radius = width / 2
-
-    if p_from[2] < 0.0 and p_to[2] < 0.0 and mode == "full":
-        GL.glColor3f(1.0, 1.0, 0.0)
-        # start/end circles
-        draw_circle(p_from, radius)
-        draw_circle(p_to, radius)
-        x_out_from = p_from[0] + radius * math.sin(line_angle)
-        y_out_from = p_from[1] - radius * math.cos(line_angle)
-        x_in_from = p_from[0] + radius * math.sin(line_angle + math.pi)
-        y_in_from = p_from[1] - radius * math.cos(line_angle + math.pi)
-        x_out_to = p_to[0] + radius * math.sin(line_angle)
-        y_out_to = p_to[1] - radius * math.cos(line_angle)
-        x_in_to = p_to[0] + radius * math.sin(line_angle + math.pi)
-        y_in_to = p_to[1] - radius * math.cos(line_angle + math.pi)
-
-        # filled line
-        GL.glBegin(GL.GL_TRIANGLE_STRIP)
-        GL.glVertex3f(x_in_from, y_in_from, p_from[2])
-        GL.glVertex3f(x_out_from, y_out_from, p_from[2])
-        GL.glVertex3f(x_in_to, y_in_to, p_to[2])
-        GL.glVertex3f(x_out_to, y_out_to, p_to[2])
-        GL.glEnd()
-
-    # center line
-    if options != "OFF":
-        GL.glColor3f(0.91, 0.0, 0.0)
-    else:
-        GL.glColor3f(0.11, 0.63, 0.36)
-    GL.glBegin(GL.GL_LINES)
-    GL.glVertex3fv(p_from)
-    GL.glVertex3fv(p_to)
-    GL.glEnd()
-
-    if mode != "minimal":
-        lenght = calc_distance(p_from, p_to)
-        if lenght < 3:
-            return
-        # direction arrow
-        GL.glColor3f(0.62, 0.73, 0.82)
-        center = p_from
-        if lenght > 5.0:
-            center = line_center_3d(p_from, p_to)
-        x_arrow = center[0] - 3 * math.sin(line_angle + math.pi / 2.0)
-        y_arrow = center[1] + 3 * math.cos(line_angle + math.pi / 2.0)
-        x_arrow_left = x_arrow + 1 * math.sin(line_angle + math.pi)
-        y_arrow_left = y_arrow - 1 * math.cos(line_angle + math.pi)
-        x_arrow_right = x_arrow + 1 * math.sin(line_angle)
-        y_arrow_right = y_arrow - 1 * math.cos(line_angle)
-        GL.glBegin(GL.GL_LINES)
-        GL.glVertex3f(center[0], center[1], center[2] + 0.01)
-        GL.glVertex3f(x_arrow_left, y_arrow_left, center[2] + 0.01)
-        GL.glVertex3f(center[0], center[1], center[2] + 0.01)
-        GL.glVertex3f(x_arrow_right, y_arrow_right, center[2] + 0.01)
-        GL.glEnd()
-
-
-def draw_text(
+    return np.array(points)
+
+
+CIRCLE_POINTS = circle_points()
+
+
+def tool_ring_points() -> np.ndarray:
+    """gets the (13, 2) closed unit ring of the simulated tool"""
+    points = []
+    angle = 0.0
+    step = math.pi / 6
+    while angle < math.pi * 2:
+        points.append((math.cos(angle), math.sin(angle)))
+        angle += step
+    points.append((1.0, 0.0))
+    return np.array(points)
+
+
+TOOL_RING_POINTS = tool_ring_points()
+
+
+def tool_vertices(pos: tuple, radius: float, height: float) -> np.ndarray:
+    """gets the quad strip vertices of the simulated tool at pos"""
+    vertices = np.empty((len(TOOL_RING_POINTS), 2, 3))
+    vertices[:, :, 0] = (pos[0] + radius * TOOL_RING_POINTS[:, 0])[:, np.newaxis]
+    vertices[:, :, 1] = (pos[1] + radius * TOOL_RING_POINTS[:, 1])[:, np.newaxis]
+    vertices[:, 0, 2] = pos[2] + height
+    vertices[:, 1, 2] = pos[2]
+    return vertices.reshape(-1, 3)
+
+
+def circle_triangles(circles: list) -> np.ndarray:
+    """gets the triangles of a list of (x, y, z, radius) circles as vertex array"""
+    if len(circles) == 0:
+        return np.empty((0, 3))
+    circles_array = np.array(circles, dtype=np.float64)
+    centers = circles_array[:, :3]
+    radius = circles_array[:, 3:4]
+    rim = np.empty((len(circles_array), len(CIRCLE_POINTS), 3))
+    rim[:, :, 0] = centers[:, 0:1] + radius * CIRCLE_POINTS[:, 0]
+    rim[:, :, 1] = centers[:, 1:2] + radius * CIRCLE_POINTS[:, 1]
+    rim[:, :, 2] = centers[:, 2:3]
+    # one (center, point, next point) triangle per step
+    triangles = np.empty((len(circles_array), len(CIRCLE_POINTS) - 1, 3, 3))
+    triangles[:, :, 0] = centers[:, np.newaxis, :]
+    triangles[:, :, 1] = rim[:, :-1]
+    triangles[:, :, 2] = rim[:, 1:]
+    return triangles.reshape(-1, 3)
+
+
+def draw_arrays(mode, vertices, colors=None) -> None:
+    """draws a list of vertices (and 8bit rgba colors) with a single draw call"""
+    if len(vertices) == 0:
+        return
+    GL.glEnableClientState(GL.GL_VERTEX_ARRAY)
+    GL.glVertexPointer(3, GL.GL_FLOAT, 0, np.array(vertices, dtype=np.float32))
+    if colors is not None:
+        GL.glEnableClientState(GL.GL_COLOR_ARRAY)
+        GL.glColorPointer(4, GL.GL_UNSIGNED_BYTE, 0, np.array(colors, dtype=np.uint8))
+    GL.glDrawArrays(mode, 0, len(vertices))
+    if colors is not None:
+        GL.glDisableClientState(GL.GL_COLOR_ARRAY)
+        forget_color()
+    GL.glDisableClientState(GL.GL_VERTEX_ARRAY)
+
+
+def mill_lines(simulation_data: list) -> dict:
+    """gets the vertices of all milling lines including direction and width"""
+    if len(simulation_data) == 0:
+        return {
+            "circles": np.empty((0, 4)),
+            "fills": np.empty((0, 3)),
+            "lines": np.empty((0, 3)),
+            "colors": np.empty((0, 4), dtype=np.uint8),
+        }
+    starts = np.array([line[0] for line in simulation_data], dtype=np.float64)
+    ends = np.array([line[1] for line in simulation_data], dtype=np.float64)
+    radius = np.array([line[2] for line in simulation_data], dtype=np.float64) / 2
+    modes = np.array([line[3] for line in simulation_data])
+    options = np.array([line[4] for line in simulation_data])
+    full = (starts[:, 2] < 0.0) & (ends[:, 2] < 0.0) & (modes == "full")
+
+    # moves without length (feedrate changes, ...) can only add a tool circle,
+    # skip them if there is none or the previous move has already drawn it
+    drawn_before = np.zeros(len(starts), dtype=bool)
+    drawn_before[1:] = (
+        full[:-1]
+        & np.all(starts[1:] == ends[:-1], axis=1)
+        & (radius[1:] == radius[:-1])
+    )
+    keep = np.any(starts != ends, axis=1) | (full & ~drawn_before)
+    starts = starts[keep]
+    ends = ends[keep]
+    radius = radius[keep]
+    modes = modes[keep]
+    options = options[keep]
+    full = full[keep]
+
+    delta_x = ends[:, 0] - starts[:, 0]
+    delta_y = ends[:, 1] - starts[:, 1]
+    lenght = np.hypot(delta_x, delta_y)
+    with_arrow = (modes != "minimal") & (lenght >= 3)
+    line_angle = np.arctan2(delta_y, delta_x)
+
+    # start/end circles and the two triangles of the filled line,
+    # only computed for the moves that get them
+    full_starts = starts[full]
+    full_ends = ends[full]
+    full_radius = radius[full][:, np.newaxis]
+    circles = np.empty((len(full_starts), 2, 4))
+    circles[:, 0, :3] = full_starts
+    circles[:, 1, :3] = full_ends
+    circles[:, :, 3] = full_radius
+    offset_x = full_radius * np.sin(line_angle[full])[:, np.newaxis]
+    offset_y = full_radius * np.cos(line_angle[full])[:, np.newaxis]
+    out_from = full_starts.copy()
+    out_from[:, 0:1] += offset_x
+    out_from[:, 1:2] -= offset_y
+    in_from = full_starts.copy()
+    in_from[:, 0:1] -= offset_x
+    in_from[:, 1:2] += offset_y
+    out_to = full_ends.copy()
+    out_to[:, 0:1] += offset_x
+    out_to[:, 1:2] -= offset_y
+    in_to = full_ends.copy()
+    in_to[:, 0:1] -= offset_x
+    in_to[:, 1:2] += offset_y
+    fills = np.stack((in_from, out_from, in_to, in_to, out_from, out_to), axis=1)
+
+    # center line and direction arrow, arrows only on lines of 3mm and more
+    lines = np.empty((len(starts), 6, 3))
+    lines[:, 0] = starts
+    lines[:, 1] = ends
+    sin_angle = np.sin(line_angle[with_arrow])
+    cos_angle = np.cos(line_angle[with_arrow])
+    centers = np.where(
+        (lenght[with_arrow] > 5.0)[:, np.newaxis],
+        (starts[with_arrow] + ends[with_arrow]) / 2,
+        starts[with_arrow],
+    )
+    centers[:, 2] += 0.01
+    x_arrow = centers[:, 0] - 3 * cos_angle
+    y_arrow = centers[:, 1] - 3 * sin_angle
+    lines[with_arrow, 2] = centers
+    lines[with_arrow, 3] = np.column_stack(
+        (x_arrow - sin_angle, y_arrow + cos_angle, centers[:, 2])
+    )
+    lines[with_arrow, 4] = centers
+    lines[with_arrow, 5] = np.column_stack(
+        (x_arrow + sin_angle, y_arrow - cos_angle, centers[:, 2])
+    )
+    lines_used = np.ones((len(starts), 6), dtype=bool)
+    lines_used[:, 2:] = with_arrow[:, np.newaxis]
+    line_color = np.where((options != "OFF")[:, np.newaxis], CUT_COLOR, OFF_COLOR)
+    colors = np.empty((len(starts), 6, 4), dtype=np.uint8)
+    colors[:, 0:2] = line_color[:, np.newaxis]
+    colors[:, 2:] = ARROW_COLOR
+
+    return {
+        "circles": circles.reshape((-1, 4)),
+        "fills": fills.reshape((-1, 3)),
+        "lines": lines[lines_used],
+        "colors": colors[lines_used],
+    }
+
+
+@lru_cache(maxsize=1024)
+def text_lines(text: str) -> tuple:
+    """font lines of a text with its width and height, labels repeat a lot"""
+    lines = tuple(font.lines_for_text(text))
+    width = 0.0
+    height = 0.0
+    for (x_1, y_1), (x_2, y_2) in lines:
+        width = max(width, x_1, x_2)
+        height = max(height, y_1, y_2)
+    return (lines, width, height)
+
+
+def text_vertices(
     text: str,
     pos_x: float,
     pos_y: float,
@@ -122,23 +238,30 @@ def draw_text(
     scale: float = 1.0,
     center_x: bool = False,
     center_y: bool = False,
-) -> None:
-    test_data = tuple(font.lines_for_text(text))
-    if center_x or center_y:
-        width = 0.0
-        height = 0.0
-        for (x_1, y_1), (x_2, y_2) in test_data:
-            width = max(width, x_1 * scale)
-            width = max(width, x_2 * scale)
-            height = max(height, y_1 * scale)
-            height = max(height, y_2 * scale)
-        if center_x:
-            pos_x -= width / 2.0
-        if center_y:
-            pos_y -= height / 2.0
-    for (x_1, y_1), (x_2, y_2) in test_data:
-        GL.glVertex3f(pos_x + x_1 * scale, pos_y + y_1 * scale, pos_z)
-        GL.glVertex3f(pos_x + x_2 * scale, pos_y + y_2 * scale, pos_z)
+) -> list:
+    """line vertices of a text"""
+    lines, width, height = text_lines(text)
+    if center_x:
+        pos_x -= width * scale / 2.0
+    if center_y:
+        pos_y -= height * scale / 2.0
+    vertices = []
+    for (x_1, y_1), (x_2, y_2) in lines:
+        vertices.append((pos_x + x_1 * scale, pos_y + y_1 * scale, pos_z))
+        vertices.append((pos_x + x_2 * scale, pos_y + y_2 * scale, pos_z))
+    return vertices
+
+
+def grid_lines(
+    positions: np.ndarray, start: float, end: float, depth: float, axis: int
+) -> np.ndarray:
+    """line vertices from start to end at the positions along the axis"""
+    vertices = np.empty((len(positions) * 2, 3), dtype=np.float32)
+    vertices[:, axis] = np.repeat(positions, 2)
+    vertices[0::2, 1 - axis] = start
+    vertices[1::2, 1 - axis] = end
+    vertices[:, 2] = depth
+    return vertices
 
 
 def draw_grid(project: dict) -> None:
@@ -156,6 +279,7 @@ def draw_grid(project: dict) -> None:
     z_offset = -project["setup"]["workpiece"]["offset_z"]
     mill_depth = project["setup"]["mill"]["depth"]
     unit = project["setup"]["machine"]["unit"]
+    ruler_show = project["setup"]["view"]["ruler_show"]
     unitscale = 1.0
     if unit == "inch":
         unitscale = 25.4
@@ -164,74 +288,93 @@ def draw_grid(project: dict) -> None:
 
     if project["setup"]["view"]["grid_show"]:
         # Grid-X
-        GL.glLineWidth(0.1)
-        GL.glColor3f(0.9, 0.9, 0.9)
-        GL.glBegin(GL.GL_LINES)
-        for p_x in range(start_x, end_x + size, size):
-            GL.glVertex3f(p_x, start_y, mill_depth)
-            GL.glVertex3f(p_x, end_y, mill_depth)
-        if project["setup"]["view"]["ruler_show"] and size >= 5:
+        set_line_width(0.1)
+        set_color(0.9, 0.9, 0.9)
+        draw_arrays(
+            GL.GL_LINES,
+            grid_lines(
+                np.arange(start_x, end_x + size, size), start_y, end_y, mill_depth, 0
+            ),
+        )
+        if ruler_show and size >= 5:
+            vertices = []
             for p_x in range(start_x, end_x, size):
-                draw_text(f"{p_x}", p_x, start_y, mill_depth, 0.4)
-        GL.glEnd()
+                vertices += text_vertices(f"{p_x}", p_x, start_y, mill_depth, 0.4)
+            draw_arrays(GL.GL_LINES, vertices)
 
         # Grid-Y
-        GL.glLineWidth(0.1)
-        GL.glColor3f(0.9, 0.9, 0.9)
-        GL.glBegin(GL.GL_LINES)
-        for p_y in range(start_y, end_y + size, size):
-            GL.glVertex3f(start_x, p_y, mill_depth)
-            GL.glVertex3f(end_x, p_y, mill_depth)
-        if project["setup"]["view"]["ruler_show"] and size >= 5:
+        set_line_width(0.1)
+        set_color(0.9, 0.9, 0.9)
+        draw_arrays(
+            GL.GL_LINES,
+            grid_lines(
+                np.arange(start_y, end_y + size, size), start_x, end_x, mill_depth, 1
+            ),
+        )
+        if ruler_show and size >= 5:
+            vertices = []
             for p_y in range(start_y, end_y, size):
-                draw_text(f"{p_y}", start_x, p_y, mill_depth, 0.4)
-        GL.glEnd()
+                vertices += text_vertices(f"{p_y}", start_x, p_y, mill_depth, 0.4)
+            draw_arrays(GL.GL_LINES, vertices)
 
     # Zero-Z
-    GL.glLineWidth(1)
-    GL.glColor3f(1.0, 1.0, 0.0)
-    GL.glBegin(GL.GL_LINES)
-    GL.glVertex3f(0.0, 0.0, 100.0)
-    GL.glVertex3f(0.0, 0.0, mill_depth)
-    GL.glVertex3f(-1, -1, 0.0)
-    GL.glVertex3f(1, 1, 0.0)
-    GL.glVertex3f(-1, 1, 0.0)
-    GL.glVertex3f(1, -1, 0.0)
-    GL.glEnd()
+    set_line_width(1)
+    set_color(1.0, 1.0, 0.0)
+    draw_arrays(
+        GL.GL_LINES,
+        [
+            (0.0, 0.0, 100.0),
+            (0.0, 0.0, mill_depth),
+            (-1, -1, 0.0),
+            (1, 1, 0.0),
+            (-1, 1, 0.0),
+            (1, -1, 0.0),
+        ],
+    )
 
     # Z-Offset
     if z_offset:
-        GL.glLineWidth(1)
-        GL.glColor3f(1.0, 0.0, 1.0)
-        GL.glBegin(GL.GL_LINES)
-        GL.glVertex3f(-2, -1, z_offset)
-        GL.glVertex3f(2, 2, z_offset)
-        GL.glVertex3f(-2, 2, z_offset)
-        GL.glVertex3f(2, -2, z_offset)
-        GL.glEnd()
+        set_line_width(1)
+        set_color(1.0, 0.0, 1.0)
+        draw_arrays(
+            GL.GL_LINES,
+            [
+                (-2, -1, z_offset),
+                (2, 2, z_offset),
+                (-2, 2, z_offset),
+                (2, -2, z_offset),
+            ],
+        )
 
     # Zero-X
-    GL.glColor3f(0.5, 0.0, 0.0)
-    GL.glBegin(GL.GL_LINES)
-    GL.glVertex3f(0.0, start_y, mill_depth)
-    GL.glVertex3f(0.0, end_y, mill_depth)
-    GL.glEnd()
+    set_color(0.5, 0.0, 0.0)
+    draw_arrays(
+        GL.GL_LINES,
+        [
+            (0.0, start_y, mill_depth),
+            (0.0, end_y, mill_depth),
+        ],
+    )
     # Zero-Y
-    GL.glColor3f(0.0, 0.0, 0.5)
-    GL.glBegin(GL.GL_LINES)
-    GL.glVertex3f(start_x, 0.0, mill_depth)
-    GL.glVertex3f(end_x, 0.0, mill_depth)
-    GL.glEnd()
+    set_color(0.0, 0.0, 0.5)
+    draw_arrays(
+        GL.GL_LINES,
+        [
+            (start_x, 0.0, mill_depth),
+            (end_x, 0.0, mill_depth),
+        ],
+    )
 
-    if project["setup"]["view"]["ruler_show"]:
+    if ruler_show:
         # MinMax-X
-        GL.glColor3f(0.5, 0.0, 0.0)
-        GL.glBegin(GL.GL_LINES)
-        GL.glVertex3f(min_max[0], start_y - 5, mill_depth)
-        GL.glVertex3f(min_max[0], end_y, mill_depth)
-        GL.glVertex3f(min_max[2], start_y - 5, mill_depth)
-        GL.glVertex3f(min_max[2], end_y, mill_depth)
-        draw_text(
+        set_color(0.5, 0.0, 0.0)
+        vertices = [
+            (min_max[0], start_y - 5, mill_depth),
+            (min_max[0], end_y, mill_depth),
+            (min_max[2], start_y - 5, mill_depth),
+            (min_max[2], end_y, mill_depth),
+        ]
+        vertices += text_vertices(
             f"{round(min_max[0], 2)}",
             min_max[0],
             start_y - 5 - 6,
@@ -239,7 +382,7 @@ def draw_grid(project: dict) -> None:
             0.5,
             True,
         )
-        draw_text(
+        vertices += text_vertices(
             f"{round(min_max[2], 2)}",
             min_max[2],
             start_y - 5 - 6,
@@ -247,15 +390,16 @@ def draw_grid(project: dict) -> None:
             0.5,
             True,
         )
-        GL.glEnd()
+        draw_arrays(GL.GL_LINES, vertices)
         # MinMax-Y
-        GL.glColor3f(0.0, 0.0, 0.5)
-        GL.glBegin(GL.GL_LINES)
-        GL.glVertex3f(start_x, min_max[1], mill_depth)
-        GL.glVertex3f(end_x + 5, min_max[1], mill_depth)
-        GL.glVertex3f(start_x, min_max[3], mill_depth)
-        GL.glVertex3f(end_x + 5, min_max[3], mill_depth)
-        draw_text(
+        set_color(0.0, 0.0, 0.5)
+        vertices = [
+            (start_x, min_max[1], mill_depth),
+            (end_x + 5, min_max[1], mill_depth),
+            (start_x, min_max[3], mill_depth),
+            (end_x + 5, min_max[3], mill_depth),
+        ]
+        vertices += text_vertices(
             f"{round(min_max[1], 2)}",
             end_x + 5,
             min_max[1],
@@ -264,7 +408,7 @@ def draw_grid(project: dict) -> None:
             False,
             True,
         )
-        draw_text(
+        vertices += text_vertices(
             f"{round(min_max[3], 2)}",
             end_x + 5,
             min_max[3],
@@ -273,28 +417,36 @@ def draw_grid(project: dict) -> None:
             False,
             True,
         )
-        GL.glEnd()
+        draw_arrays(GL.GL_LINES, vertices)
         # Size-X
-        GL.glColor3f(1.0, 0.0, 0.0)
-        GL.glBegin(GL.GL_LINES)
-        draw_text(
-            f"{round(size_x, 2)}", center_x, start_y - 5 - 6, mill_depth, 0.5, True
+        set_color(1.0, 0.0, 0.0)
+        draw_arrays(
+            GL.GL_LINES,
+            text_vertices(
+                f"{round(size_x, 2)}", center_x, start_y - 5 - 6, mill_depth, 0.5, True
+            ),
         )
-        GL.glEnd()
         # Size-Y
-        GL.glColor3f(0.0, 0.0, 1.0)
-        GL.glBegin(GL.GL_LINES)
-        draw_text(
-            f"{round(size_y, 2)}", end_x + 5, center_y, mill_depth, 0.5, False, True
+        set_color(0.0, 0.0, 1.0)
+        draw_arrays(
+            GL.GL_LINES,
+            text_vertices(
+                f"{round(size_y, 2)}",
+                end_x + 5,
+                center_y,
+                mill_depth,
+                0.5,
+                False,
+                True,
+            ),
         )
-        GL.glEnd()
 
 
 def draw_object_ids(project: dict) -> None:
     """draws the object id's as text"""
-    GL.glLineWidth(2)
-    GL.glColor3f(0.63, 0.36, 0.11)
-    GL.glBegin(GL.GL_LINES)
+    set_line_width(2)
+    set_color(0.63, 0.36, 0.11)
+    vertices = []
     for obj_idx, obj in project["objects"].items():
         if obj.get("layer", "").startswith("BREAKS:") or obj.get(
             "layer", ""
@@ -302,20 +454,19 @@ def draw_object_ids(project: dict) -> None:
             continue
         p_x = obj["segments"][0]["start"][0]
         p_y = obj["segments"][0]["start"][1]
-        for (x_1, y_1), (x_2, y_2) in font.lines_for_text(f"#{obj_idx}"):
-            GL.glVertex3f(p_x + x_1, p_y + y_1, 5.0)
-            GL.glVertex3f(p_x + x_2, p_y + y_2, 5.0)
-    GL.glEnd()
+        vertices += text_vertices(f"#{obj_idx}", p_x, p_y, 5.0)
+    draw_arrays(GL.GL_LINES, vertices)
 
 
-def bulge_points(segment):
+@lru_cache(maxsize=16384)
+def _bulge_points(start_x, start_y, end_x, end_y, bulge) -> tuple:
     points = []
     (
         center,
         start_angle,  # pylint: disable=W0612
         end_angle,  # pylint: disable=W0612
         radius,  # pylint: disable=W0612
-    ) = ezdxf.math.bulge_to_arc(segment.start, segment.end, segment.bulge)
+    ) = bulge_to_arc((start_x, start_y), (end_x, end_y), bulge)
     while start_angle > end_angle:
         start_angle -= math.pi
     steps = abs(start_angle - end_angle) / 10
@@ -327,7 +478,57 @@ def bulge_points(segment):
             points.append((ap_x, ap_y))
             angle += steps
 
-    return points
+    return tuple(points)
+
+
+def bulge_points(segment) -> tuple:
+    """gets the interpolated points of an arc segment, cached over redraws"""
+    args = (
+        segment.start[0],
+        segment.start[1],
+        segment.end[0],
+        segment.end[1],
+        segment.bulge,
+    )
+    # 0.0 and -0.0 share a cache key but may give different points
+    if 0.0 in args:
+        return _bulge_points.__wrapped__(*args)
+    return _bulge_points(*args)
+
+
+def object_edge_vertices(obj, depth: float, interpolate: bool) -> list:
+    """line vertices of the side, top and bottom edges of an object"""
+    sides = []
+    top = []
+    bottom = []
+    for segment in obj.segments:
+        p_x = segment.start[0]
+        p_y = segment.start[1]
+        sides.append((p_x, p_y, 0.0))
+        sides.append((p_x, p_y, depth))
+        if segment.bulge != 0.0 and interpolate:
+            for point in bulge_points(segment):
+                top.append((p_x, p_y, 0.0))
+                top.append((point[0], point[1], 0.0))
+                bottom.append((p_x, p_y, depth))
+                bottom.append((point[0], point[1], depth))
+                p_x = point[0]
+                p_y = point[1]
+        top.append((p_x, p_y, 0.0))
+        top.append((segment.end[0], segment.end[1], 0.0))
+        bottom.append((p_x, p_y, depth))
+        bottom.append((segment.end[0], segment.end[1], depth))
+    return sides + top + bottom
+
+
+def cross_vertices(pos_x: float, pos_y: float, depth: float) -> tuple:
+    """gets the lines of the x shaped selection marker"""
+    return (
+        (pos_x - 1, pos_y - 1, depth),
+        (pos_x + 1, pos_y + 1, depth),
+        (pos_x - 1, pos_y + 1, depth),
+        (pos_x + 1, pos_y - 1, depth),
+    )
 
 
 def draw_object_edges(project: dict, selected: int = -1) -> None:
@@ -348,81 +549,33 @@ def draw_object_edges(project: dict, selected: int = -1) -> None:
         ).startswith("_TABS"):
             continue
         if obj_idx == selected:
-            GL.glLineWidth(5)
-            GL.glColor4f(1.0, 0.0, 0.0, 1.0)
+            set_line_width(5)
+            set_color(1.0, 0.0, 0.0, 1.0)
         else:
-            GL.glLineWidth(1)
-            GL.glColor4f(1.0, 1.0, 1.0, 1.0)
+            set_line_width(1)
+            set_color(1.0, 1.0, 1.0, 1.0)
 
-        # side
-        GL.glBegin(GL.GL_LINES)
-        for segment in obj.segments:
-            p_x = segment.start[0]
-            p_y = segment.start[1]
-            GL.glVertex3f(p_x, p_y, 0.0)
-            GL.glVertex3f(p_x, p_y, depth)
-        GL.glEnd()
-
-        # top
-        GL.glBegin(GL.GL_LINES)
-        for segment in obj.segments:
-            if segment.bulge != 0.0 and interpolate:
-                last_x = segment.start[0]
-                last_y = segment.start[1]
-                for point in bulge_points(segment):
-                    GL.glVertex3f(last_x, last_y, 0.0)
-                    GL.glVertex3f(point[0], point[1], 0.0)
-                    last_x = point[0]
-                    last_y = point[1]
-                GL.glVertex3f(last_x, last_y, 0.0)
-                GL.glVertex3f(segment.end[0], segment.end[1], 0.0)
-            else:
-                GL.glVertex3f(segment.start[0], segment.start[1], 0.0)
-                GL.glVertex3f(segment.end[0], segment.end[1], 0.0)
-        GL.glEnd()
-
-        # bottom
-        GL.glBegin(GL.GL_LINES)
-        for segment in obj.segments:
-            if segment.bulge != 0.0 and interpolate:
-                last_x = segment.start[0]
-                last_y = segment.start[1]
-                for point in bulge_points(segment):
-                    GL.glVertex3f(last_x, last_y, depth)
-                    GL.glVertex3f(point[0], point[1], depth)
-                    last_x = point[0]
-                    last_y = point[1]
-                GL.glVertex3f(last_x, last_y, depth)
-                GL.glVertex3f(segment.end[0], segment.end[1], depth)
-            else:
-                GL.glVertex3f(segment.start[0], segment.start[1], depth)
-                GL.glVertex3f(segment.end[0], segment.end[1], depth)
-        GL.glEnd()
+        draw_arrays(GL.GL_LINES, object_edge_vertices(obj, depth, interpolate))
 
         # start points
         start = obj.get("start", ())
         if start:
             depth = 0.1
-            GL.glLineWidth(5)
-            GL.glColor4f(1.0, 1.0, 0.0, 1.0)
-            GL.glBegin(GL.GL_LINES)
-            GL.glVertex3f(start[0] - 1, start[1] - 1, depth)
-            GL.glVertex3f(start[0] + 1, start[1] + 1, depth)
-            GL.glVertex3f(start[0] - 1, start[1] + 1, depth)
-            GL.glVertex3f(start[0] + 1, start[1] - 1, depth)
-            GL.glEnd()
+            set_line_width(5)
+            set_color(1.0, 1.0, 0.0, 1.0)
+            draw_arrays(GL.GL_LINES, cross_vertices(start[0], start[1], depth))
 
     # tabs
     tabs = project.get("tabs", {}).get("data", ())
     if tabs:
         tabs_depth = depth + tabs_height
-        GL.glLineWidth(5)
-        GL.glColor4f(1.0, 1.0, 0.0, 1.0)
-        GL.glBegin(GL.GL_LINES)
+        set_line_width(5)
+        set_color(1.0, 1.0, 0.0, 1.0)
+        vertices = []
         for tab in tabs:
-            GL.glVertex3f(tab[0][0], tab[0][1], tabs_depth)
-            GL.glVertex3f(tab[1][0], tab[1][1], tabs_depth)
-        GL.glEnd()
+            vertices.append((tab[0][0], tab[0][1], tabs_depth))
+            vertices.append((tab[1][0], tab[1][1], tabs_depth))
+        draw_arrays(GL.GL_LINES, vertices)
 
 
 def draw_object_faces(project: dict) -> None:
@@ -437,8 +590,9 @@ def draw_object_faces(project: dict) -> None:
         unitscale = 25.4
         depth *= unitscale
 
-    # object faces (side)
-    GL.glColor4f(color[0], color[1], color[2], alpha)
+    # object faces (side), each quad as two triangles
+    set_color(color[0], color[1], color[2], alpha)
+    vertices = []
     for obj in project["objects"].values():
         if obj.get("layer", "").startswith("BREAKS:") or obj.get(
             "layer", ""
@@ -447,34 +601,24 @@ def draw_object_faces(project: dict) -> None:
         for segment in obj.segments:
             last_x = segment.start[0]
             last_y = segment.start[1]
+            points = [(segment.end[0], segment.end[1])]
             if segment.bulge != 0.0 and interpolate:
-                for point in bulge_points(segment):
-                    GL.glBegin(GL.GL_TRIANGLE_STRIP)
-                    GL.glVertex3f(last_x, last_y, 0.0)
-                    GL.glVertex3f(last_x, last_y, depth)
-                    GL.glVertex3f(point[0], point[1], 0.0)
-                    GL.glVertex3f(point[0], point[1], depth)
-                    GL.glEnd()
-                    last_x = point[0]
-                    last_y = point[1]
-            GL.glBegin(GL.GL_TRIANGLE_STRIP)
-            GL.glVertex3f(last_x, last_y, 0.0)
-            GL.glVertex3f(last_x, last_y, depth)
-            GL.glVertex3f(segment.end[0], segment.end[1], 0.0)
-            GL.glVertex3f(segment.end[0], segment.end[1], depth)
-            GL.glEnd()
+                points = list(bulge_points(segment)) + points
+            for point in points:
+                vertices += [
+                    (last_x, last_y, 0.0),
+                    (last_x, last_y, depth),
+                    (point[0], point[1], 0.0),
+                    (point[0], point[1], 0.0),
+                    (last_x, last_y, depth),
+                    (point[0], point[1], depth),
+                ]
+                last_x = point[0]
+                last_y = point[1]
+    draw_arrays(GL.GL_TRIANGLES, vertices)
 
     # object faces (top)
-    GL.glColor4f(color[0], color[1], color[2], alpha)
-    tess = gluNewTess()
-    gluTessProperty(tess, GLU_TESS_WINDING_RULE, GLU_TESS_WINDING_ODD)
-    gluTessCallback(tess, GLU_TESS_BEGIN, GL.glBegin)
-    gluTessCallback(tess, GLU_TESS_VERTEX, GL.glVertex)
-    gluTessCallback(tess, GLU_TESS_END, GL.glEnd)
-    gluTessCallback(
-        tess, GLU_TESS_COMBINE, lambda _points, _vertices, _weights: _points
-    )
-    gluTessBeginPolygon(tess, 0)
+    contours = []
     for obj in project["objects"].values():
         if obj.get("layer", "").startswith("BREAKS:") or obj.get(
             "layer", ""
@@ -482,20 +626,67 @@ def draw_object_faces(project: dict) -> None:
             continue
 
         if obj.closed:
-            gluTessBeginContour(tess)
+            contour = []
             for segment in obj.segments:
-                p_xy = (segment.start[0], segment.start[1], 0.0)
-                gluTessVertex(tess, p_xy, p_xy)
+                contour.append((segment.start[0], segment.start[1], 0.0))
                 if segment.bulge != 0.0 and interpolate:
                     for point in bulge_points(segment):
-                        p_xy = (point[0], point[1], 0.0)
-                        gluTessVertex(tess, p_xy, p_xy)
-                p_xy = (segment.end[0], segment.end[1], 0.0)
-                gluTessVertex(tess, p_xy, p_xy)
-            gluTessEndContour(tess)
+                        contour.append((point[0], point[1], 0.0))
+                contour.append((segment.end[0], segment.end[1], 0.0))
+            contours.append(tuple(contour))
+    set_color(color[0], color[1], color[2], alpha)
+    draw_arrays(GL.GL_TRIANGLES, tessellate(tuple(contours)))
+
+
+def primitive_triangles(mode: int, vertices: list) -> list:
+    """converts a triangle fan or strip into single triangles"""
+    if mode == GL.GL_TRIANGLE_FAN:
+        triangles = []
+        for num in range(1, len(vertices) - 1):
+            triangles += [vertices[0], vertices[num], vertices[num + 1]]
+        return triangles
+    if mode == GL.GL_TRIANGLE_STRIP:
+        triangles = []
+        for num in range(len(vertices) - 2):
+            if num % 2 == 0:
+                triangles += [vertices[num], vertices[num + 1], vertices[num + 2]]
+            else:
+                triangles += [vertices[num + 1], vertices[num], vertices[num + 2]]
+        return triangles
+    return vertices
+
+
+@lru_cache(maxsize=16)
+def tessellate(contours: tuple) -> tuple:
+    """tessellates the contours (odd winding) into triangle vertices"""
+    triangles: list = []
+    vertices: list = []
+    primitive = {"mode": GL.GL_TRIANGLES}
+
+    def tess_begin(mode):
+        primitive["mode"] = mode
+        vertices.clear()
 
+    def tess_end():
+        triangles.extend(primitive_triangles(primitive["mode"], vertices))
+
+    tess = gluNewTess()
+    gluTessProperty(tess, GLU_TESS_WINDING_RULE, GLU_TESS_WINDING_ODD)
+    gluTessCallback(tess, GLU_TESS_BEGIN, tess_begin)
+    gluTessCallback(tess, GLU_TESS_VERTEX, vertices.append)
+    gluTessCallback(tess, GLU_TESS_END, tess_end)
+    gluTessCallback(
+        tess, GLU_TESS_COMBINE, lambda _points, _vertices, _weights: _points
+    )
+    gluTessBeginPolygon(tess, 0)
+    for contour in contours:
+        gluTessBeginContour(tess)
+        for p_xy in contour:
+            gluTessVertex(tess, p_xy, p_xy)
+        gluTessEndContour(tess)
     gluTessEndPolygon(tess)
     gluDeleteTess(tess)
+    return tuple(tuple(vertex) for vertex in triangles)
 
 
 def draw_line(p_1: dict, p_2: dict, options: str, project: dict) -> None:
@@ -523,13 +714,25 @@ def draw_line(p_1: dict, p_2: dict, options: str, project: dict) -> None:
 
     project["simulation_data"].append((p_from, p_to, line_width, mode, options))
 
-    draw_mill_line(p_from, p_to, line_width, mode, options)
+
+def draw_mill_lines(simulation_data: list) -> None:
+    """draws all milling lines batched by primitive type"""
+    batch = mill_lines(simulation_data)
+    set_color(1.0, 1.0, 0.0)
+    draw_arrays(GL.GL_TRIANGLES, circle_triangles(batch["circles"]))
+    draw_arrays(GL.GL_TRIANGLES, batch["fills"])
+    draw_arrays(GL.GL_LINES, batch["lines"], batch["colors"])
+
+
+def draw_tool(pos: tuple, radius: float, height: float) -> None:
+    """draws the simulated tool as cylinder"""
+    draw_arrays(GL.GL_QUAD_STRIP, tool_vertices(pos, radius, height))
 
 
 def draw_machinecode_path(project: dict) -> bool:
     """draws the machinecode path"""
     project["simulation_data"] = []
-    GL.glLineWidth(2)
+    set_line_width(2)
     try:
         if project["suffix"] in {"ngc", "gcode"}:
             GcodeParser(project["machine_cmd"]).draw(draw_line, (project,))
@@ -539,5 +742,7 @@ def draw_machinecode_path(project: dict) -> bool:
             HpglParser(project["machine_cmd"]).draw(draw_line, (project,))
     except Exception as error_string:  # pylint: disable=W0703:
         print(f"ERROR: parsing machine_cmd: {error_string}")
+        draw_mill_lines(project["simulation_data"])
         return False
+    draw_mill_lines(project["simulation_data"])
     return True
@@ -0,0 +1,35 @@
+"""skips gl state changes that would set the current value again
+
+the cache only knows what was set through these functions, so reset_state() must
+be called whenever the gl state may have changed behind its back
+(at glNewList, after glCallList, after foreign drawing code).
+"""
+
+from OpenGL import GL
+
+_state: dict = {}
+
+
+def reset_state() -> None:
+    """forget the cached gl state"""
+    _state.clear()
+
+
+def set_color(red: float, green: float, blue: float, alpha: float = 1.0) -> None:
+    """sets the current color"""
+    color = (red, green, blue, alpha)
+    if _state.get("color") != color:
+        _state["color"] = color
+        GL.glColor4f(red, green, blue, alpha)
+
+
+def set_line_width(width: float) -> None:
+    """sets the line width"""
+    if _state.get("line_width") != width:
+        _state["line_width"] = width
+        GL.glLineWidth(width)
+
+
+def forget_color() -> None:
+    """marks the current color as unknown, i.e. after drawing a color array"""
+    _state.pop("color", None)
@@ -6,7 +6,6 @@ import math
 import ezdxf
 
 from ..calc import calc_distance  # pylint: disable=E0402
-from ..ext import svgpathtools
 from ..input_plugins_base import DrawReaderBase
 from ..vc_types import VcSegment
 
@@ -18,6 +17,9 @@ class DrawReader(DrawReaderBase):
         self, filename: str, args: argparse.Namespace = None
     ):  # pylint: disable=W0613
         """converting svg into single segments."""
+        # svgpathtools pulls in svgwrite, only import it when a svg is loaded
+        from ..ext import svgpathtools  # pylint: disable=C0415,E0402
+
         self.filename = filename
         self.segments: list[dict] = []
 
@@ -1,16 +1,20 @@
 """generates machine commands"""
 import math
-from typing import Union
+from typing import Optional, Union
 
-import ezdxf
+import numpy as np
 
 from .calc import (
     angle_of_line,
+    arc_to_bulge,
+    bulge_to_arc,
     calc_distance,
-    found_next_offset_point,
+    fuzy_match,
     lines_intersect,
-    rotate_list,
-    vertex2points,
+    nearest_point_num,
+    path_distances,
+    start_point_cache,
+    vertex_array_cache,
     vertex_data_cache,
 )
 
@@ -167,11 +171,13 @@ def machine_cmd_end(project: dict, post: PostProcessor) -> None:
 def segment2machine_cmd(
     project: dict,
     post: PostProcessor,
-    last: list,
-    point: list,
+    last: tuple,
+    point: tuple,
     set_depth: float,
     max_depth: float,
     tabs: dict,
+    *,
+    arc: Optional[tuple] = None,
 ) -> None:
     bulge = last[2]
     if last[0] == point[0] and last[1] == point[1] and last[2] == point[2]:
@@ -184,150 +190,37 @@ def segment2machine_cmd(
     tabs_depth = min(tabs_depth, 0.0)
     tabs_type = tabs.get("type", "rectangle")
 
-    if bulge > 0.0:
-        (
-            center,
-            start_angle,  # pylint: disable=W0612
-            end_angle,  # pylint: disable=W0612
-            radius,  # pylint: disable=W0612
-        ) = ezdxf.math.bulge_to_arc(last, point, bulge)
-        circumference = 2 * radius * math.pi
-        arc_lenght = (end_angle - start_angle) * circumference / (math.pi * 2)
-        tab_width = min(tab_width, arc_lenght)
-        tab_angle = (math.pi * 2) / (circumference / tab_width)
-
-        for tab in tabs.get("data", ()):
-            inters = lines_intersect(
-                (last[0], last[1]), (point[0], point[1]), tab[0], tab[1]
-            )
-            if inters:
-                half_angle = (
-                    start_angle + (end_angle - start_angle) / 2 - (tab_angle / 2)
-                )
-                (start, end, bulge) = ezdxf.math.arc_to_bulge(  # pylint: disable=W0612
-                    center,
-                    start_angle,
-                    half_angle,
-                    radius,
-                )
-                post.arc_ccw(
-                    x_pos=end[0],
-                    y_pos=end[1],
-                    z_pos=set_depth,
-                    i_pos=(center[0] - last[0]),
-                    j_pos=(center[1] - last[1]),
-                )
-                last = end
-
-                if (
-                    project["setup"]["machine"]["mode"] != "mill"
-                    or "Z" not in project["axis"]
-                ):
-                    post.spindle_off()
-
-                if tabs_type == "rectangle":
-                    post.linear(
-                        x_pos=end[0],
-                        y_pos=end[1],
-                        z_pos=tabs_depth,
-                    )
-                else:
-                    half_angle = start_angle + (end_angle - start_angle) / 2
-                    (
-                        start,
-                        end,
-                        bulge,
-                    ) = ezdxf.math.arc_to_bulge(  # pylint: disable=W0612
-                        center,
-                        start_angle,
-                        half_angle,
-                        radius,
-                    )
-                    post.arc_ccw(
-                        x_pos=end[0],
-                        y_pos=end[1],
-                        z_pos=tabs_depth,
-                        i_pos=(center[0] - last[0]),
-                        j_pos=(center[1] - last[1]),
-                    )
-                    last = end
-
-                half_angle = (
-                    start_angle + (end_angle - start_angle) / 2 + (tab_angle / 2)
-                )
-                (start, end, bulge) = ezdxf.math.arc_to_bulge(  # pylint: disable=W0612
-                    center,
-                    start_angle,
-                    half_angle,
-                    radius,
-                )
-                if tabs_type == "rectangle":
-                    post.arc_ccw(
-                        x_pos=end[0],
-                        y_pos=end[1],
-                        z_pos=tabs_depth,
-                        i_pos=(center[0] - last[0]),
-                        j_pos=(center[1] - last[1]),
-                    )
-                    post.linear(
-                        x_pos=end[0],
-                        y_pos=end[1],
-                        z_pos=set_depth,
-                    )
-                else:
-                    post.arc_ccw(
-                        x_pos=end[0],
-                        y_pos=end[1],
-                        z_pos=set_depth,
-                        i_pos=(center[0] - last[0]),
-                        j_pos=(center[1] - last[1]),
-                    )
-                last = end
-                if (
-                    project["setup"]["machine"]["mode"] != "mill"
-                    or "Z" not in project["axis"]
-                ):
-                    post.spindle_cw(
-                        project["setup"]["tool"]["speed"],
-                        project["setup"]["tool"]["pause"],
-                    )
-                break
-
-        post.arc_ccw(
-            x_pos=point[0],
-            y_pos=point[1],
-            z_pos=set_depth,
-            i_pos=(center[0] - last[0]),
-            j_pos=(center[1] - last[1]),
-        )
-
-    elif bulge < 0.0:
+    if bulge != 0.0:
+        if arc is None:
+            arc = bulge_to_arc(last, point, bulge)
+        # positive bulges are counter-clockwise arcs, negative ones clockwise
+        post_arc = post.arc_ccw if bulge > 0.0 else post.arc_cw
         (
             center,
             start_angle,
             end_angle,
             radius,
-        ) = ezdxf.math.bulge_to_arc(last, point, bulge)
+        ) = arc
         circumference = 2 * radius * math.pi
         arc_lenght = (end_angle - start_angle) * circumference / (math.pi * 2)
         tab_width = min(tab_width, arc_lenght)
         tab_angle = (math.pi * 2) / (circumference / tab_width)
+        # the tab gap is mirrored on clockwise arcs
+        tab_offset = tab_angle / 2 if bulge > 0.0 else -tab_angle / 2
 
         for tab in tabs.get("data", ()):
             inters = lines_intersect(
                 (last[0], last[1]), (point[0], point[1]), tab[0], tab[1]
             )
             if inters:
-                half_angle = (
-                    start_angle + (end_angle - start_angle) / 2 + (tab_angle / 2)
-                )
-                (start, end, bulge) = ezdxf.math.arc_to_bulge(  # pylint: disable=W0612
+                half_angle = start_angle + (end_angle - start_angle) / 2 - tab_offset
+                (start, end, bulge) = arc_to_bulge(  # pylint: disable=W0612
                     center,
                     start_angle,
                     half_angle,
                     radius,
                 )
-                post.arc_cw(
+                post_arc(
                     x_pos=end[0],
                     y_pos=end[1],
                     z_pos=set_depth,
@@ -350,17 +243,13 @@ def segment2machine_cmd(
                     )
                 else:
                     half_angle = start_angle + (end_angle - start_angle) / 2
-                    (
-                        start,
-                        end,
-                        bulge,
-                    ) = ezdxf.math.arc_to_bulge(  # pylint: disable=W0612
+                    (start, end, bulge,) = arc_to_bulge(  # pylint: disable=W0612
                         center,
                         start_angle,
                         half_angle,
                         radius,
                     )
-                    post.arc_cw(
+                    post_arc(
                         x_pos=end[0],
                         y_pos=end[1],
                         z_pos=tabs_depth,
@@ -369,17 +258,15 @@ def segment2machine_cmd(
                     )
                     last = end
 
-                half_angle = (
-                    start_angle + (end_angle - start_angle) / 2 - (tab_angle / 2)
-                )
-                (start, end, bulge) = ezdxf.math.arc_to_bulge(  # pylint: disable=W0612
+                half_angle = start_angle + (end_angle - start_angle) / 2 + tab_offset
+                (start, end, bulge) = arc_to_bulge(  # pylint: disable=W0612
                     center,
                     start_angle,
                     half_angle,
                     radius,
                 )
                 if tabs_type == "rectangle":
-                    post.arc_cw(
+                    post_arc(
                         x_pos=end[0],
                         y_pos=end[1],
                         z_pos=tabs_depth,
@@ -392,14 +279,13 @@ def segment2machine_cmd(
                         z_pos=set_depth,
                     )
                 else:
-                    post.arc_cw(
+                    post_arc(
                         x_pos=end[0],
                         y_pos=end[1],
                         z_pos=set_depth,
                         i_pos=(center[0] - last[0]),
                         j_pos=(center[1] - last[1]),
                     )
-
                 last = end
                 if (
                     project["setup"]["machine"]["mode"] != "mill"
@@ -411,7 +297,7 @@ def segment2machine_cmd(
                     )
                 break
 
-        post.arc_cw(
+        post_arc(
             x_pos=point[0],
             y_pos=point[1],
             z_pos=set_depth,
@@ -474,16 +360,24 @@ def segment2machine_cmd(
 def get_nearest_free_object(
     polylines,
     level: int,
-    last_pos: list,
+    last_pos: tuple,
     milling: set,
     is_pocket: bool,
     next_filter: str,
+    level_offsets: Union[None, dict] = None,
 ) -> tuple:
     found: bool = False
     nearest_dist: Union[None, float] = None
-    nearest_idx: int = 0
+    nearest_idx: str = ""
     nearest_point = 0
-    for offset_num, offset in polylines.items():
+    if next_filter:
+        offset_nums = [next_filter] if next_filter in polylines else []
+    elif level_offsets is not None:
+        offset_nums = level_offsets.get(level, [])
+    else:
+        offset_nums = list(polylines)
+    for offset_num in offset_nums:
+        offset = polylines[offset_num]
         if offset_num not in milling and (  # pylint: disable=R0916
             (
                 next_filter == ""
@@ -494,23 +388,23 @@ def get_nearest_free_object(
             or next_filter == offset_num
         ):
             if offset.is_pocket == 1 and offset.setup["pockets"]["insideout"]:
+                # only the last free offset of this pocket
                 pocket_filter = None
-                offset_num_pre = offset_num.split(".")[0]
-                for pocket_offset_num in polylines:
+                offset_num_pre = f"{offset_num.split('.')[0]}."
+                for pocket_offset_num in reversed(polylines):
                     if (
                         pocket_offset_num not in milling
-                        and pocket_offset_num.startswith(f"{offset_num_pre}.")
+                        and pocket_offset_num.startswith(offset_num_pre)
                     ):
                         pocket_filter = pocket_offset_num
+                        break
                 if offset_num != pocket_filter:
                     continue
 
             vertex_data = vertex_data_cache(offset)
             if offset.is_closed():
                 if offset.start:
-                    point_num = found_next_offset_point(
-                        (offset.start[0], offset.start[1]), offset
-                    )
+                    point_num = start_point_cache(offset)
                     if point_num:
                         point_num = point_num[2]
                         pos_x = vertex_data[0][point_num]
@@ -522,15 +416,14 @@ def get_nearest_free_object(
                             nearest_point = point_num
                             found = True
                 else:
-                    point_num = 0
-                    for pos_x, pos_y in zip(vertex_data[0], vertex_data[1]):
-                        dist = calc_distance(last_pos, (pos_x, pos_y))
+                    points = vertex_array_cache(offset)
+                    if len(points) > 0:
+                        point_num, dist = nearest_point_num(last_pos, points)
                         if nearest_dist is None or dist < nearest_dist:
                             nearest_dist = dist
                             nearest_idx = offset_num
                             nearest_point = point_num
                             found = True
-                        point_num += 1
             else:
                 # on open objects, test first and last point
                 if len(vertex_data) > 0 and len(vertex_data[0]) > 0:
@@ -558,7 +451,7 @@ def get_nearest_free_object(
 def polylines2machine_cmd(project: dict, post: PostProcessor) -> str:
     """generates machine_cmd from polilines"""
     milling: set = set()
-    last_pos: list = [0, 0]
+    last_pos: tuple = (0, 0)
     polylines = project["offsets"]
     machine_cmd_begin(project, post)
     tabs = project.get("tabs", {})
@@ -570,9 +463,16 @@ def polylines2machine_cmd(project: dict, post: PostProcessor) -> str:
         unitscale = 25.4
         fast_move_z *= unitscale
 
+    # offsets by level, so each search only scans the current level
+    level_offsets: dict = {}
+    for offset_num, offset in polylines.items():
+        level_offsets.setdefault(offset.level, []).append(offset_num)
+
     next_filter = ""
     order = 0
     was_pocket = False
+    # depth of the tool at last_pos, None if it left the path (lead-out, open object)
+    last_end_depth: Union[None, float] = None
     for level in range(project["maxOuter"], -1, -1):
         for is_pocket in (True, False):
             while True:
@@ -582,7 +482,13 @@ def polylines2machine_cmd(project: dict, post: PostProcessor) -> str:
                     nearest_point,
                     nearest_dist,
                 ) = get_nearest_free_object(
-                    polylines, level, last_pos, milling, is_pocket, next_filter
+                    polylines,
+                    level,
+                    last_pos,
+                    milling,
+                    is_pocket,
+                    next_filter,
+                    level_offsets,
                 )
                 next_filter = ""
                 if found:
@@ -612,32 +518,42 @@ def polylines2machine_cmd(project: dict, post: PostProcessor) -> str:
                         polyline.setup["tabs"]["data"] = []
 
                     if is_closed:
-                        points = rotate_list(vertex2points(vertex_data), nearest_point)
+                        vertex_data = np.roll(vertex_data, -nearest_point, axis=1)
                     elif nearest_point != 0:
                         # redir open line and reverse bulge
-                        x_start = list(vertex_data[0])
-                        x_start.reverse()
-                        y_start = list(vertex_data[1])
-                        y_start.reverse()
-                        bulges = list(vertex_data[2])
-                        bulges.reverse()
-                        bulges = rotate_list(bulges, 1)
-                        for num, point in enumerate(bulges):
-                            bulges[num] = -bulges[num]
-                        points = vertex2points((x_start, y_start, bulges))
-                    else:
-                        points = vertex2points(vertex_data)
+                        vertex_data = np.array(
+                            (
+                                vertex_data[0][::-1],
+                                vertex_data[1][::-1],
+                                -np.roll(vertex_data[2][::-1], -1),
+                            )
+                        )
+                    # plain float tuples, faster to work with than numpy scalars
+                    points = list(map(tuple, np.transpose(vertex_data).tolist()))
 
                     helix_mode = polyline.setup["mill"]["helix_mode"]
 
                     # get object distance
-                    obj_distance = 0
-                    last = points[0]
-                    for point in points:
-                        obj_distance += calc_distance(point, last)
-                        last = point
-                    if is_closed:
-                        obj_distance += calc_distance(point, points[0])
+                    distances = path_distances(points, is_closed)
+                    obj_distance = float(distances[-1])
+
+                    # segments and arcs are the same on every depth pass
+                    path = points + [points[0]] if is_closed else points
+                    segments = [
+                        (
+                            last,
+                            point,
+                            bulge_to_arc(last, point, last[2])
+                            if last[2] != 0.0
+                            else None,
+                        )
+                        for last, point in zip(path, path[1:])
+                    ]
+                    if helix_mode and obj_distance:
+                        # part of the depth step reached at each segment end
+                        helix_fractions = distances[1:] / obj_distance
+                    else:
+                        helix_fractions = np.zeros(len(segments))
 
                     if project["setup"]["machine"]["comments"]:
                         post.separation()
@@ -673,14 +589,39 @@ def polylines2machine_cmd(project: dict, post: PostProcessor) -> str:
                     depth = step
                     depth = max(depth, max_depth)
 
+                    lead_in_active = polyline.setup["leads"]["in"]
+                    lead_out_active = polyline.setup["leads"]["out"]
+                    if not is_closed:
+                        # only on closed contours
+                        lead_in_active = "off"
+                        lead_out_active = "off"
+                    if not polyline.start:
+                        # only if a start point is set
+                        lead_in_active = "off"
+                        lead_out_active = "off"
+
+                    # closed object starts where the last one ended, no need to lift
+                    same_start = (
+                        is_closed
+                        and lead_in_active == "off"
+                        and last_end_depth is not None
+                        and last_end_depth <= (0.0 if helix_mode else depth)
+                        and fuzy_match(last_pos, points[0])
+                    )
+                    # without a lead-out, closed objects end on their start point
+                    ends_on_start = is_closed and lead_out_active == "off"
+
                     if (
                         project["setup"]["machine"]["mode"] == "mill"
                         and "Z" in project["axis"]
                     ):
-                        if not (
-                            was_pocket
-                            and is_pocket
-                            and nearest_dist < project["setup"]["tool"]["diameter"]
+                        if (
+                            not (
+                                was_pocket
+                                and is_pocket
+                                and nearest_dist < project["setup"]["tool"]["diameter"]
+                            )
+                            and not same_start
                         ):
                             post.move(z_pos=fast_move_z)
                         elif helix_mode:
@@ -695,17 +636,6 @@ def polylines2machine_cmd(project: dict, post: PostProcessor) -> str:
                         depth = 0.0
                         post.move(z_pos=depth)
 
-                    lead_in_active = polyline.setup["leads"]["in"]
-                    lead_out_active = polyline.setup["leads"]["out"]
-                    if not is_closed:
-                        # only on closed contours
-                        lead_in_active = "off"
-                        lead_out_active = "off"
-                    if not polyline.start:
-                        # only if a start point is set
-                        lead_in_active = "off"
-                        lead_out_active = "off"
-
                     if lead_in_active != "off":
                         lead_in_lenght = polyline.setup["leads"]["in_lenght"]
                         line_angle = angle_of_line(points[0], points[1])
@@ -856,39 +786,13 @@ def polylines2machine_cmd(project: dict, post: PostProcessor) -> str:
                                     )
                             lead_in_active = "off"
 
-                        trav_distance = 0
-                        last = points[0]
-                        for point in points:
-                            if helix_mode:
-                                trav_distance += calc_distance(point, last)
-                                depth_diff = depth - last_depth
-                                set_depth = last_depth + (
-                                    trav_distance / obj_distance * depth_diff
-                                )
-                            else:
-                                set_depth = depth
-                            segment2machine_cmd(
-                                project,
-                                post,
-                                last,
-                                point,
-                                set_depth,
-                                max_depth,
-                                polyline.setup["tabs"],
-                            )
-                            last = point
-
-                        if is_closed:
-                            point = points[0]
-
-                            if helix_mode:
-                                trav_distance += calc_distance(point, last)
-                                depth_diff = depth - last_depth
-                                set_depth = last_depth + (
-                                    trav_distance / obj_distance * depth_diff
-                                )
-                            else:
-                                set_depth = depth
+                        if helix_mode:
+                            set_depths = (
+                                last_depth + helix_fractions * (depth - last_depth)
+                            ).tolist()
+                        else:
+                            set_depths = [depth] * len(segments)
+                        for (last, point, arc), set_depth in zip(segments, set_depths):
                             segment2machine_cmd(
                                 project,
                                 post,
@@ -897,6 +801,7 @@ def polylines2machine_cmd(project: dict, post: PostProcessor) -> str:
                                 set_depth,
                                 max_depth,
                                 polyline.setup["tabs"],
+                                arc=arc,
                             )
 
                         last_depth = depth
@@ -950,6 +855,7 @@ def polylines2machine_cmd(project: dict, post: PostProcessor) -> str:
                         last_pos = points[0]
                     else:
                         last_pos = points[-1]
+                    last_end_depth = last_depth if ends_on_start else None
                     order += 1
                 else:
                     break
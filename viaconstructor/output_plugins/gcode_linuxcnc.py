@@ -13,6 +13,10 @@ class PostProcessorGcodeLinuxCNC(PostProcessor):
         self.offsets: tuple[float, float, float] = (0.0, 0.0, 0.0)
         self.offsets_reset = False
         self.scale: float = 1.0
+        # formatted X/Y/Z values by position, only valid for the current offsets and scale
+        self.axis_cache: tuple[dict, dict, dict] = ({}, {}, {})
+        # last emitted X/Y/Z values, positions that format the same are not repeated
+        self.axis_values: list[str] = ["", "", ""]
 
     def separation(self) -> None:
         if self.comments:
@@ -37,6 +41,8 @@ class PostProcessorGcodeLinuxCNC(PostProcessor):
             else:
                 self.gcode.append("G20")
             self.scale = 1.0 / 25.4
+        self.axis_cache = ({}, {}, {})
+        self.axis_values = ["", "", ""]
 
     def absolute(self, active=True) -> None:
         if active:
@@ -82,6 +88,7 @@ class PostProcessorGcodeLinuxCNC(PostProcessor):
                 offsets[1] / self.scale,
                 offsets[2] / self.scale,
             )
+            self.axis_cache = ({}, {}, {})
 
     def program_end(self) -> None:
         if self.offsets_reset:
@@ -92,19 +99,58 @@ class PostProcessorGcodeLinuxCNC(PostProcessor):
         if self.comments:
             self.gcode.append(f"({text})")
 
-    def move(self, x_pos=None, y_pos=None, z_pos=None) -> None:
-        line = []
+    def _axis(self, axis: int, pos: float) -> str:
+        """formats an axis position including offset and scale, cached by position"""
+        cache = self.axis_cache[axis]
+        value = cache.get(pos)
+        if value is None:
+            value = f"{(pos + self.offsets[axis]) * self.scale:.6f}"
+            # 0.0 and -0.0 share a key but may format differently
+            if pos != 0.0 and len(cache) < 8192:
+                cache[pos] = value
+        return value
+
+    def _xyz(self, x_pos, y_pos, z_pos) -> str:
+        """formats the changed axis positions, each with a leading space"""
+        line = ""
+        x_cache, y_cache, z_cache = self.axis_cache
+        values = self.axis_values
         if x_pos is not None and self.x_pos != x_pos:
-            line.append(f"X{round((x_pos + self.offsets[0]) * self.scale, 6):.6f}")
+            value = x_cache.get(x_pos) or self._axis(0, x_pos)
+            if values[0] != value:
+                line += " X" + value
+                values[0] = value
             self.x_pos = x_pos
         if y_pos is not None and self.y_pos != y_pos:
-            line.append(f"Y{round((y_pos + self.offsets[1]) * self.scale, 6):.6f}")
+            value = y_cache.get(y_pos) or self._axis(1, y_pos)
+            if values[1] != value:
+                line += " Y" + value
+                values[1] = value
             self.y_pos = y_pos
         if z_pos is not None and self.z_pos != z_pos:
-            line.append(f"Z{round((z_pos + self.offsets[2]) * self.scale, 6):.6f}")
+            value = z_cache.get(z_pos) or self._axis(2, z_pos)
+            if values[2] != value:
+                line += " Z" + value
+                values[2] = value
             self.z_pos = z_pos
+        return line
+
+    @staticmethod
+    def _ijr(i_pos, j_pos, r_pos) -> str:
+        """formats the arc center / radius, each with a leading space"""
+        line = ""
+        if i_pos is not None:
+            line += f" I{i_pos:.6f}"
+        if j_pos is not None:
+            line += f" J{j_pos:.6f}"
+        if r_pos is not None:
+            line += f" R{r_pos:.6f}"
+        return line
+
+    def move(self, x_pos=None, y_pos=None, z_pos=None) -> None:
+        line = self._xyz(x_pos, y_pos, z_pos)
         if line:
-            self.gcode.append("G00 " + " ".join(line))
+            self.gcode.append("G00" + line)
 
     def tool(self, number="1") -> None:
         self.gcode.append(f"M06 T{number}")
@@ -125,10 +171,9 @@ class PostProcessorGcodeLinuxCNC(PostProcessor):
         self.gcode.append(cmd)
 
         if pause:
-            if self.comments:
-                self.gcode.append(f"G04 P{pause} (pause in sec)")
-            else:
-                self.gcode.append(f"G04 P{pause}")
+            self.gcode.append(
+                f"G04 P{pause} (pause in sec)" if self.comments else f"G04 P{pause}"
+            )
 
     def spindle_ccw(self, speed: int, pause: int = 1) -> None:
         cmd = "M04"
@@ -140,68 +185,45 @@ class PostProcessorGcodeLinuxCNC(PostProcessor):
         self.gcode.append(cmd)
 
         if pause:
-            if self.comments:
-                self.gcode.append(f"G04 P{pause} (pause in sec)")
-            else:
-                self.gcode.append(f"G04 P{pause}")
+            self.gcode.append(
+                f"G04 P{pause} (pause in sec)" if self.comments else f"G04 P{pause}"
+            )
 
     def linear(self, x_pos=None, y_pos=None, z_pos=None) -> None:
-        line = []
-        if x_pos is not None and self.x_pos != x_pos:
-            line.append(f"X{round((x_pos + self.offsets[0]) * self.scale, 6):.6f}")
-            self.x_pos = x_pos
-        if y_pos is not None and self.y_pos != y_pos:
-            line.append(f"Y{round((y_pos + self.offsets[1]) * self.scale, 6):.6f}")
-            self.y_pos = y_pos
-        if z_pos is not None and self.z_pos != z_pos:
-            line.append(f"Z{round((z_pos + self.offsets[2]) * self.scale, 6):.6f}")
-            self.z_pos = z_pos
+        line = self._xyz(x_pos, y_pos, z_pos)
         if line:
-            self.gcode.append("G01 " + " ".join(line))
+            self.gcode.append("G01" + line)
+
+    def _arc(self, code, *, x_pos, y_pos, z_pos, i_pos, j_pos, r_pos) -> None:
+        line = self._xyz(x_pos, y_pos, z_pos) + self._ijr(i_pos, j_pos, r_pos)
+        if line:
+            self.gcode.append(code + line)
 
     def arc_cw(
         self, x_pos=None, y_pos=None, z_pos=None, i_pos=None, j_pos=None, r_pos=None
     ) -> None:
-        line = []
-        if x_pos is not None and self.x_pos != x_pos:
-            line.append(f"X{round((x_pos + self.offsets[0]) * self.scale, 6):.6f}")
-            self.x_pos = x_pos
-        if y_pos is not None and self.y_pos != y_pos:
-            line.append(f"Y{round((y_pos + self.offsets[1]) * self.scale, 6):.6f}")
-            self.y_pos = y_pos
-        if z_pos is not None and self.z_pos != z_pos:
-            line.append(f"Z{round((z_pos + self.offsets[2]) * self.scale, 6):.6f}")
-            self.z_pos = z_pos
-        if i_pos is not None:
-            line.append(f"I{round(i_pos, 6):.6f}")
-        if j_pos is not None:
-            line.append(f"J{round(j_pos, 6):.6f}")
-        if r_pos is not None:
-            line.append(f"R{round(r_pos, 6):.6f}")
-        if line:
-            self.gcode.append("G02 " + " ".join(line))
+        self._arc(
+            "G02",
+            x_pos=x_pos,
+            y_pos=y_pos,
+            z_pos=z_pos,
+            i_pos=i_pos,
+            j_pos=j_pos,
+            r_pos=r_pos,
+        )
 
     def arc_ccw(
         self, x_pos=None, y_pos=None, z_pos=None, i_pos=None, j_pos=None, r_pos=None
     ) -> None:
-        line = []
-        if x_pos is not None and self.x_pos != x_pos:
-            line.append(f"X{round((x_pos + self.offsets[0]) * self.scale, 6):.6f}")
-            self.x_pos = x_pos
-        if y_pos is not None and self.y_pos != y_pos:
-            line.append(f"Y{round((y_pos + self.offsets[1]) * self.scale, 6):.6f}")
-            self.y_pos = y_pos
-        if z_pos is not None and self.z_pos != z_pos:
-            line.append(f"Z{round((z_pos + self.offsets[2]) * self.scale, 6):.6f}")
-            self.z_pos = z_pos
-        if i_pos is not None:
-            line.append(f"I{round(i_pos, 6):.6f}")
-        if j_pos is not None:
-            line.append(f"J{round(j_pos, 6):.6f}")
-        if r_pos is not None:
-            line.append(f"R{round(r_pos, 6):.6f}")
-        if line:
-            self.gcode.append("G03 " + " ".join(line))
+        self._arc(
+            "G03",
+            x_pos=x_pos,
+            y_pos=y_pos,
+            z_pos=z_pos,
+            i_pos=i_pos,
+            j_pos=j_pos,
+            r_pos=r_pos,
+        )
 
     def get(self) -> str:
         return "\n".join(self.gcode)
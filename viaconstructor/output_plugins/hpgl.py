@@ -1,3 +1,4 @@
+import io
 import math
 
 from ..calc import angle_of_line, calc_distance  # pylint: disable=E0402
@@ -66,7 +67,7 @@ class PostProcessorHpgl(PostProcessor):
             self.z_pos = int((z_pos + self.offsets[2]) * self.scale)
         if x_pos is not None or y_pos is not None:
             self.hpgl.append("PU")
-            self.hpgl.append(f"{int(self.x_pos)},{int(self.y_pos)}")
+            self.hpgl.append(f"{self.x_pos},{self.y_pos}")
             self.last_x = self.x_pos
             self.last_y = self.y_pos
 
@@ -79,7 +80,7 @@ class PostProcessorHpgl(PostProcessor):
             self.z_pos = int((z_pos + self.offsets[2]) * self.scale)
         if x_pos is not None or y_pos is not None:
             self.hpgl.append(f"P{'D' if self.toolrun else 'U'}")
-            self.hpgl.append(f"{int(self.x_pos)},{int(self.y_pos)}")
+            self.hpgl.append(f"{self.x_pos},{self.y_pos}")
             self.last_x = self.x_pos
             self.last_y = self.y_pos
 
@@ -101,7 +102,7 @@ class PostProcessorHpgl(PostProcessor):
                     x_pos = int(center_x - radius * math.sin(angle - math.pi / 2))
                     y_pos = int(center_y + radius * math.cos(angle - math.pi / 2))
                     if x_pos != last_x and y_pos != last_y:
-                        self.hpgl.append(f"{int(x_pos)},{int(y_pos)}")
+                        self.hpgl.append(f"{x_pos},{y_pos}")
                     last_x = x_pos
                     last_y = y_pos
                     angle += 0.2
@@ -166,20 +167,25 @@ class PostProcessorHpgl(PostProcessor):
             self.last_y = self.y_pos
 
     def get(self) -> str:
-        output = ""
+        output = io.StringIO()
         last_word = ""
+        delimiter = ""
         for cmd in self.hpgl:
             if cmd == "":
-                output = output.strip(",")
-                output += ";\n"
+                output.write(";\n")
+                delimiter = ""
             elif cmd[0].isnumeric() or cmd[0] == "-":
-                output += cmd + ","
+                output.write(delimiter)
+                output.write(cmd)
+                delimiter = ","
             else:
                 if last_word != cmd:
-                    output = output.strip(",")
-                    output += ";\n" + cmd
+                    output.write(";\n")
+                    output.write(cmd)
                     last_word = cmd
-        return output
+                    delimiter = ""
+        output.write(delimiter)
+        return output.getvalue()
 
     @staticmethod
     def suffix() -> str:
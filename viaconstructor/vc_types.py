@@ -1,11 +1,5 @@
 class VcSegment:
-    type = ""
-    object = None
-    layer = ""
-    start = ()
-    end = ()
-    bulge = 0.0
-    center = ()
+    __slots__ = ("type", "object", "layer", "start", "end", "bulge", "center")
 
     def __init__(self, data):
         self.type = data.get("type", "")
@@ -19,6 +13,18 @@ class VcSegment:
     def __repr__(self):
         return f"VcSegment {self.start}->{self.end}"
 
+    def copy(self):
+        """copies the segment, all values are immutable."""
+        segment = VcSegment.__new__(VcSegment)
+        segment.type = self.type
+        segment.object = self.object
+        segment.layer = self.layer
+        segment.start = self.start
+        segment.end = self.end
+        segment.bulge = self.bulge
+        segment.center = self.center
+        return segment
+
     def dump(self):
         return {
             "type": self.type,
@@ -7,15 +7,17 @@ import json
 import math
 import os
 import re
+import shlex
+import subprocess
 import sys
 import time
-from copy import deepcopy
 from functools import partial
 from pathlib import Path
-from typing import Optional, Union
+from typing import Any, Callable, Optional, Union
 
 import ezdxf
 import setproctitle
+from PyQt5.QtCore import QTimer  # pylint: disable=E0611
 from PyQt5.QtGui import (  # pylint: disable=E0611
     QIcon,
     QStandardItem,
@@ -51,31 +53,41 @@ from PyQt5.QtWidgets import (  # pylint: disable=E0611
 )
 
 from .calc import (
+    bulge_to_arc,
     calc_distance,
     calc_distance3d,
     clean_segments,
+    copy_setup,
     find_tool_offsets,
-    found_next_open_segment_point,
+    found_next_open_segment_points,
     found_next_point_on_segment,
     found_next_segment_point,
     found_next_tab_point,
     line_center_2d,
+    merge_setup,
+    mirror_minmax,
     mirror_objects,
+    move_minmax,
     move_objects,
     objects2minmax,
     objects2polyline_offsets,
     point_of_line3d,
+    rotate_minmax,
     rotate_objects,
     scale_objects,
     segments2objects,
 )
 from .gldraw import (
+    cross_vertices,
+    draw_arrays,
     draw_grid,
     draw_machinecode_path,
     draw_object_edges,
     draw_object_faces,
     draw_object_ids,
+    draw_tool,
 )
+from .glstate import reset_state
 from .input_plugins_base import DrawReaderBase
 from .machine_cmd import polylines2machine_cmd
 from .output_plugins.gcode_linuxcnc import PostProcessorGcodeLinuxCNC
@@ -92,24 +104,53 @@ except ImportError:
 
 
 reader_plugins: dict = {}
+# file suffix -> reader, the first plugin wins
+suffix_readers: dict = {}
 for reader in ("dxfread", "hpglread", "stlread", "svgread", "ttfread", "imgread"):
     try:
         drawing_reader = importlib.import_module(
             f".{reader}", "viaconstructor.input_plugins"
         )
         reader_plugins[reader] = drawing_reader.DrawReader
+        for reader_suffix in drawing_reader.DrawReader.suffix():
+            suffix_readers.setdefault(reader_suffix, drawing_reader.DrawReader)
     except Exception as reader_error:  # pylint: disable=W0703
         sys.stderr.write(f"ERRO while loading input plugin {reader}: {reader_error}\n")
 
 
 DEBUG = False
 TIMESTAMP = 0
+# skip the per-entry icon lookups, slow on network mounts
+FILE_DIALOG_OPTIONS = QFileDialog.DontUseCustomDirectoryIcons
+# setup entry type -> value from an object table change
+OBJECT_VALUE_TYPES: dict[str, Callable[[Any], Any]] = {
+    "bool": lambda value: bool(value == 2),
+    "select": str,
+    "float": float,
+    "int": int,
+    "str": str,
+    "table": lambda value: value,
+    "color": lambda value: value,
+}
+# setup entry type -> value of its global setup widget
+WIDGET_VALUE_GETTERS: dict[str, Callable[[Any], Any]] = {
+    "bool": lambda widget: widget.isChecked(),
+    "select": lambda widget: widget.currentText(),
+    "float": lambda widget: widget.value(),
+    "int": lambda widget: widget.value(),
+    "str": lambda widget: widget.text(),
+}
 
 
 def eprint(message, *args, **kwargs):  # pylint: disable=W0613
     sys.stderr.write(f"{message}\n")
 
 
+def with_suffix(filename: str, suffix: str) -> str:
+    """replaces the suffix of a filename."""
+    return f"{os.path.splitext(filename)[0]}.{suffix}"
+
+
 def debug(message):
     global TIMESTAMP  # pylint: disable=W0603
     if DEBUG:
@@ -172,6 +213,8 @@ class GLWidget(QGLWidget):
     selection = ()
     selection_set = ()
     size_x = 0
+    # repaint on the next timer tick, the scene or the view has changed
+    dirty = True
     size_y = 0
 
     def __init__(self, project: dict, update_drawing):
@@ -185,6 +228,21 @@ class GLWidget(QGLWidget):
 
     def initializeGL(self) -> None:  # pylint: disable=C0103
         """glinit function."""
+        self._update_projection()
+        GL.glClearColor(0.0, 0.0, 0.0, 1.0)
+        GL.glClear(GL.GL_COLOR_BUFFER_BIT | GL.GL_DEPTH_BUFFER_BIT)
+        GL.glClearDepth(1.0)
+        GL.glEnable(GL.GL_DEPTH_TEST)
+        GL.glDisable(GL.GL_CULL_FACE)
+        GL.glEnable(GL.GL_NORMALIZE)
+        GL.glDepthFunc(GL.GL_LEQUAL)
+        GL.glDepthMask(GL.GL_TRUE)
+        GL.glEnable(GL.GL_BLEND)
+        GL.glBlendFunc(GL.GL_SRC_ALPHA, GL.GL_ONE_MINUS_SRC_ALPHA)
+
+    def _update_projection(self) -> None:
+        """sets the projection matrix for the current view and size."""
+        self.dirty = True
         GL.glMatrixMode(GL.GL_PROJECTION)
         GL.glLoadIdentity()
 
@@ -205,27 +263,18 @@ class GLWidget(QGLWidget):
 
         GL.glMatrixMode(GL.GL_MODELVIEW)
         GL.glLoadIdentity()
-        GL.glClearColor(0.0, 0.0, 0.0, 1.0)
-        GL.glClear(GL.GL_COLOR_BUFFER_BIT | GL.GL_DEPTH_BUFFER_BIT)
-        GL.glClearDepth(1.0)
-        GL.glEnable(GL.GL_DEPTH_TEST)
-        GL.glDisable(GL.GL_CULL_FACE)
-        GL.glEnable(GL.GL_NORMALIZE)
-        GL.glDepthFunc(GL.GL_LEQUAL)
-        GL.glDepthMask(GL.GL_TRUE)
-        GL.glEnable(GL.GL_BLEND)
-        GL.glBlendFunc(GL.GL_SRC_ALPHA, GL.GL_ONE_MINUS_SRC_ALPHA)
 
     def resizeGL(self, width, hight) -> None:  # pylint: disable=C0103
         """glresize function."""
         self.screen_w = width
         self.screen_h = hight
         GL.glViewport(0, 0, width, hight)
-        self.initializeGL()
+        self._update_projection()
 
     def paintGL(self) -> None:  # pylint: disable=C0103
         """glpaint function."""
-        min_max = self.project["minMax"]
+        project = self.project
+        min_max = project["minMax"]
         if not min_max:
             return
 
@@ -248,107 +297,97 @@ class GLWidget(QGLWidget):
             0.0,
         )
         GL.glScalef(self.scale, self.scale, self.scale)
-        GL.glCallList(self.project["gllist"])
+        GL.glCallList(project["gllist"])
 
-        if self.selection:
+        selection = self.selection
+        if selection:
             if self.selector_mode == "start":
                 # depth = self.project["setup"]["mill"]["depth"] - 0.1
                 depth = 0.1
                 GL.glLineWidth(5)
                 GL.glColor4f(0.0, 1.0, 1.0, 1.0)
-                GL.glBegin(GL.GL_LINES)
-                GL.glVertex3f(self.selection[2][0] - 1, self.selection[2][1] - 1, depth)
-                GL.glVertex3f(self.selection[2][0] + 1, self.selection[2][1] + 1, depth)
-                GL.glVertex3f(self.selection[2][0] - 1, self.selection[2][1] + 1, depth)
-                GL.glVertex3f(self.selection[2][0] + 1, self.selection[2][1] - 1, depth)
-                GL.glEnd()
+                draw_arrays(
+                    GL.GL_LINES,
+                    cross_vertices(selection[2][0], selection[2][1], depth),
+                )
             elif self.selector_mode == "repair":
-                if len(self.selection) > 4:
+                if len(selection) > 4:
                     depth = 0.1
                     GL.glLineWidth(15)
                     GL.glColor4f(1.0, 0.0, 0.0, 1.0)
-                    GL.glBegin(GL.GL_LINES)
-                    GL.glVertex3f(self.selection[0], self.selection[1], depth)
-                    GL.glVertex3f(self.selection[4], self.selection[5], depth)
-                    GL.glEnd()
+                    draw_arrays(
+                        GL.GL_LINES,
+                        (
+                            (selection[0], selection[1], depth),
+                            (selection[4], selection[5], depth),
+                        ),
+                    )
             elif self.selector_mode == "delete":
                 depth = 0.1
                 GL.glLineWidth(5)
                 GL.glColor4f(1.0, 0.0, 0.0, 1.0)
-                GL.glBegin(GL.GL_LINES)
-                GL.glVertex3f(self.selection[0] - 1, self.selection[1] - 1, depth)
-                GL.glVertex3f(self.selection[0] + 1, self.selection[1] + 1, depth)
-                GL.glVertex3f(self.selection[0] - 1, self.selection[1] + 1, depth)
-                GL.glVertex3f(self.selection[0] + 1, self.selection[1] - 1, depth)
-                GL.glEnd()
+                draw_arrays(
+                    GL.GL_LINES,
+                    cross_vertices(selection[0], selection[1], depth),
+                )
             elif self.selector_mode == "oselect":
                 depth = 0.1
                 GL.glLineWidth(5)
                 GL.glColor4f(0.0, 1.0, 0.0, 1.0)
-                GL.glBegin(GL.GL_LINES)
-                GL.glVertex3f(self.selection[0] - 1, self.selection[1] - 1, depth)
-                GL.glVertex3f(self.selection[0] + 1, self.selection[1] + 1, depth)
-                GL.glVertex3f(self.selection[0] - 1, self.selection[1] + 1, depth)
-                GL.glVertex3f(self.selection[0] + 1, self.selection[1] - 1, depth)
-                GL.glEnd()
+                draw_arrays(
+                    GL.GL_LINES,
+                    cross_vertices(selection[0], selection[1], depth),
+                )
             else:
-                depth = self.project["setup"]["mill"]["depth"] - 0.1
+                depth = project["setup"]["mill"]["depth"] - 0.1
                 GL.glLineWidth(5)
                 GL.glColor4f(0.0, 1.0, 1.0, 1.0)
-                GL.glBegin(GL.GL_LINES)
-                GL.glVertex3f(self.selection[0][0], self.selection[0][1], depth)
-                GL.glVertex3f(self.selection[1][0], self.selection[1][1], depth)
-                GL.glEnd()
-
-        if self.project["simulation"] >= 0:
-            last_pos = self.project["simulation_last"]
-            sim_step = self.project["simulation"]
-            next_pos = self.project["simulation_data"][sim_step][1]
-            spindle = self.project["simulation_data"][sim_step][4]
+                draw_arrays(
+                    GL.GL_LINES,
+                    (
+                        (selection[0][0], selection[0][1], depth),
+                        (selection[1][0], selection[1][1], depth),
+                    ),
+                )
+
+        sim_step = project["simulation"]
+        if sim_step >= 0:
+            simulation_data = project["simulation_data"]
+            last_pos = project["simulation_last"]
+            next_pos = simulation_data[sim_step][1]
+            spindle = simulation_data[sim_step][4]
             dist = calc_distance3d(last_pos, next_pos)
             if dist >= 1.0:
                 pdist = 1.0 / dist
                 next_pos = point_of_line3d(last_pos, next_pos, pdist)
             else:
                 pdist = 1.0
-            self.project["simulation_last"] = next_pos
+            project["simulation_last"] = next_pos
 
             GL.glLineWidth(1)
             if spindle == "OFF":
                 GL.glColor3f(0.11, 0.63, 0.36)
             else:
                 GL.glColor3f(0.91, 0.0, 0.0)
-            astep = math.pi / 6
-            radius = self.project["setup"]["tool"]["diameter"] / 2.0
-            height = -self.project["setup"]["mill"]["depth"] + 5
-            GL.glBegin(GL.GL_QUAD_STRIP)
-            angle = 0.0
-            while angle < math.pi * 2:
-                x_pos = radius * math.cos(angle)
-                y_pos = radius * math.sin(angle)
-                GL.glVertex3f(
-                    next_pos[0] + x_pos, next_pos[1] + y_pos, next_pos[2] + height
-                )
-                GL.glVertex3f(next_pos[0] + x_pos, next_pos[1] + y_pos, next_pos[2])
-                angle = angle + astep
-            GL.glVertex3f(next_pos[0] + radius, next_pos[1], next_pos[2] + height)
-            GL.glVertex3f(next_pos[0] + radius, next_pos[1], next_pos[2])
-            GL.glEnd()
+            setup = project["setup"]
+            radius = setup["tool"]["diameter"] / 2.0
+            height = -setup["mill"]["depth"] + 5
+            draw_tool(next_pos, radius, height)
 
             if pdist >= 1.0:
-                if (
-                    self.project["simulation"]
-                    < len(self.project["simulation_data"]) - 1
-                ):
-                    self.project["simulation"] += 1
+                if sim_step < len(simulation_data) - 1:
+                    project["simulation"] = sim_step + 1
                 else:
-                    self.project["simulation"] = -1
+                    project["simulation"] = -1
+                    # one more frame to remove the tool
+                    self.dirty = True
 
         GL.glPopMatrix()
 
     def toggle_tab_selector(self) -> bool:
         self.selection = ()
         self.selection_set = ()
+        self.dirty = True
         if self.selector_mode == "":
             self.selector_mode = "tab"
             self.view_2d()
@@ -361,6 +400,7 @@ class GLWidget(QGLWidget):
     def toggle_start_selector(self) -> bool:
         self.selection = ()
         self.selection_set = ()
+        self.dirty = True
         if self.selector_mode == "":
             self.selector_mode = "start"
             self.view_2d()
@@ -373,6 +413,7 @@ class GLWidget(QGLWidget):
     def toggle_repair_selector(self) -> bool:
         self.selection = ()
         self.selection_set = ()
+        self.dirty = True
         if self.selector_mode == "":
             self.selector_mode = "repair"
             self.view_2d()
@@ -385,6 +426,7 @@ class GLWidget(QGLWidget):
     def toggle_delete_selector(self) -> bool:
         self.selection = ()
         self.selection_set = ()
+        self.dirty = True
         if self.selector_mode == "":
             self.selector_mode = "delete"
             self.view_2d()
@@ -397,6 +439,7 @@ class GLWidget(QGLWidget):
     def toggle_object_selector(self) -> bool:
         self.selection = ()
         self.selection_set = ()
+        self.dirty = True
         if self.selector_mode == "":
             self.selector_mode = "oselect"
             self.view_2d()
@@ -412,7 +455,7 @@ class GLWidget(QGLWidget):
         self.rot_x = 0.0
         self.rot_y = 0.0
         self.rot_z = 0.0
-        self.initializeGL()
+        self._update_projection()
 
     def view_reset(self) -> None:
         """toggle view function."""
@@ -426,17 +469,20 @@ class GLWidget(QGLWidget):
         self.trans_y = 0.0
         self.trans_z = 0.0
         self.scale_xyz = 1.0
-        self.initializeGL()
+        self._update_projection()
 
     def timerEvent(self, event) -> None:  # pylint: disable=C0103,W0613
         """gltimer function."""
         if self.project["status"] == "INIT":
             self.project["status"] = "READY"
             self.update_drawing()
-        self.update()
+        if self.dirty or self.project["simulation"] >= 0:
+            self.dirty = False
+            self.update()
 
     def mousePressEvent(self, event) -> None:  # pylint: disable=C0103
         """mouse button pressed."""
+        self.dirty = True
         self.mbutton = event.button()
         self.mpos = event.pos()
         self.rot_x_last = self.rot_x
@@ -568,6 +614,7 @@ class GLWidget(QGLWidget):
 
     def mouseMoveEvent(self, event) -> None:  # pylint: disable=C0103
         """mouse moved."""
+        self.dirty = True
         if self.mbutton == 1:
             moffset = self.mpos - event.pos()
             self.trans_x = self.trans_x_last + moffset.x() / self.screen_w
@@ -604,16 +651,12 @@ class GLWidget(QGLWidget):
             (self.mouse_pos_x, self.mouse_pos_y) = self.mouse_pos_to_real_pos(
                 event.pos()
             )
-            self.selection = found_next_open_segment_point(
-                (self.mouse_pos_x, self.mouse_pos_y), self.project["objects"]
+            (self.selection, selection_end) = found_next_open_segment_points(
+                (self.mouse_pos_x, self.mouse_pos_y),
+                self.project["objects"],
+                max_dist=10.0,
             )
             if self.selection:
-                selection_end = found_next_open_segment_point(
-                    (self.mouse_pos_x, self.mouse_pos_y),
-                    self.project["objects"],
-                    max_dist=10.0,
-                    exclude=(self.selection[2], self.selection[3]),
-                )
                 if selection_end:
                     self.selection += selection_end
                 else:
@@ -625,17 +668,18 @@ class GLWidget(QGLWidget):
             self.trans_z = self.trans_z_last + moffset.y() / 500
             if self.ortho:
                 self.ortho = False
-                self.initializeGL()
+                self._update_projection()
         elif self.mbutton == 4:
             moffset = self.mpos - event.pos()
             self.rot_x = self.rot_x_last + -moffset.x() / 4
             self.rot_y = self.rot_y_last - moffset.y() / 4
             if self.ortho:
                 self.ortho = False
-                self.initializeGL()
+                self._update_projection()
 
     def wheelEvent(self, event) -> None:  # pylint: disable=C0103,W0613
         """mouse wheel moved."""
+        self.dirty = True
         if event.angleDelta().y() > 0:
             self.scale_xyz += 0.1
         else:
@@ -664,6 +708,7 @@ class ViaConstructor:
         "minMax": [],
         "table": [],
         "glwidget": None,
+        "glcache": {},
         "status": "INIT",
         "tabs": {
             "data": [],
@@ -681,6 +726,9 @@ class ViaConstructor:
     status_bar: Optional[QWidget] = None
     main: Optional[QMainWindow] = None
     toolbar: Optional[QToolBar] = None
+    icons: dict = {}
+    update_timer: Optional[QTimer] = None
+    pending_updates: set = set()
 
     module_root = Path(__file__).resolve().parent
 
@@ -689,21 +737,17 @@ class ViaConstructor:
             doc = ezdxf.new("R2010")
             msp = doc.modelspace()
             doc.units = ezdxf.units.MM
+            layer_attribs: dict = {}
             for obj in self.project["objects"].values():
                 for segment in obj["segments"]:
+                    dxfattribs = layer_attribs.get(segment.layer)
+                    if dxfattribs is None:
+                        dxfattribs = {"layer": segment.layer}
+                        layer_attribs[segment.layer] = dxfattribs
                     if segment["bulge"] == 0.0:
-                        msp.add_line(
-                            segment.start,
-                            segment.end,
-                            dxfattribs={"layer": segment.layer},
-                        )
+                        msp.add_line(segment.start, segment.end, dxfattribs=dxfattribs)
                     else:
-                        (
-                            center,
-                            start_angle,  # pylint: disable=W0612
-                            end_angle,  # pylint: disable=W0612
-                            radius,  # pylint: disable=W0612
-                        ) = ezdxf.math.bulge_to_arc(
+                        (center, start_angle, end_angle, radius) = bulge_to_arc(
                             segment.start, segment.end, segment.bulge
                         )
                         msp.add_arc(
@@ -711,7 +755,7 @@ class ViaConstructor:
                             radius=radius,
                             start_angle=start_angle * 180 / math.pi,
                             end_angle=end_angle * 180 / math.pi,
-                            dxfattribs={"layer": segment.layer},
+                            dxfattribs=dxfattribs,
                         )
             for vport in doc.viewports.get_config("*Active"):  # type: ignore
                 vport.dxf.grid_on = True
@@ -734,23 +778,23 @@ class ViaConstructor:
         psetup: dict = self.project["setup"]
         min_max = objects2minmax(self.project["objects"])
         self.project["minMax"] = min_max
+        offset: tuple = ()
         if psetup["workpiece"]["zero"] == "bottomLeft":
-            move_objects(self.project["objects"], -min_max[0], -min_max[1])
+            offset = (-min_max[0], -min_max[1])
         elif psetup["workpiece"]["zero"] == "bottomRight":
-            move_objects(self.project["objects"], -min_max[2], -min_max[1])
+            offset = (-min_max[2], -min_max[1])
         elif psetup["workpiece"]["zero"] == "topLeft":
-            move_objects(self.project["objects"], -min_max[0], -min_max[3])
+            offset = (-min_max[0], -min_max[3])
         elif psetup["workpiece"]["zero"] == "topRight":
-            move_objects(self.project["objects"], -min_max[2], -min_max[3])
+            offset = (-min_max[2], -min_max[3])
         elif psetup["workpiece"]["zero"] == "center":
             xdiff = min_max[2] - min_max[0]
             ydiff = min_max[3] - min_max[1]
-            move_objects(
-                self.project["objects"],
-                -min_max[0] - xdiff / 2.0,
-                -min_max[1] - ydiff / 2.0,
-            )
-        self.project["minMax"] = objects2minmax(self.project["objects"])
+            offset = (-min_max[0] - xdiff / 2.0, -min_max[1] - ydiff / 2.0)
+        if offset:
+            move_objects(self.project["objects"], offset[0], offset[1])
+            min_max = move_minmax(min_max, offset[0], offset[1])
+        self.project["minMax"] = min_max
 
         debug("run_calculation: offsets")
 
@@ -797,19 +841,19 @@ class ViaConstructor:
 
     def _toolbar_flipx(self) -> None:
         mirror_objects(self.project["objects"], self.project["minMax"], vertical=True)
-        self.project["minMax"] = objects2minmax(self.project["objects"])
+        self.project["minMax"] = mirror_minmax(self.project["minMax"], vertical=True)
         self.udate_tabs_data()
         self.update_drawing()
 
     def _toolbar_flipy(self) -> None:
         mirror_objects(self.project["objects"], self.project["minMax"], horizontal=True)
-        self.project["minMax"] = objects2minmax(self.project["objects"])
+        self.project["minMax"] = mirror_minmax(self.project["minMax"], horizontal=True)
         self.udate_tabs_data()
         self.update_drawing()
 
     def _toolbar_rotate(self) -> None:
         rotate_objects(self.project["objects"], self.project["minMax"])
-        self.project["minMax"] = objects2minmax(self.project["objects"])
+        self.project["minMax"] = rotate_minmax(self.project["minMax"])
         self.udate_tabs_data()
         self.update_drawing()
 
@@ -831,10 +875,9 @@ class ViaConstructor:
         """center view."""
         self.project["glwidget"].view_2d()
 
-    def _toolbar_toggle_tab_selector(self) -> None:
-        """tab selector."""
-        title = _("Tab-Selector")
-        if self.project["glwidget"].toggle_tab_selector():
+    def _toggle_selector(self, title: str, toggle) -> None:
+        """switches a selector mode, only one selector button can be checked."""
+        if toggle():
             for toolbutton in self.toolbuttons.values():
                 if toolbutton[5]:
                     toolbutton[7].setChecked(False)
@@ -842,71 +885,65 @@ class ViaConstructor:
         else:
             self.toolbuttons[title][7].setChecked(False)
 
+    def _toolbar_toggle_tab_selector(self) -> None:
+        """tab selector."""
+        self._toggle_selector(
+            _("Tab-Selector"), self.project["glwidget"].toggle_tab_selector
+        )
+
     def _toolbar_simulate(self) -> None:
         if self.project["simulation"] == -1:
             self.project["simulation"] = 0
             self.project["simulation_last"] = (0.0, 0.0, 0.0)
         else:
             self.project["simulation"] = -1
+        # repaint the tool on start and stop
+        self.project["glwidget"].dirty = True
 
     def _toolbar_toggle_delete_selector(self) -> None:
         """delete selector."""
-        title = _("Delete-Selector")
-        if self.project["glwidget"].toggle_delete_selector():
-            for toolbutton in self.toolbuttons.values():
-                if toolbutton[5]:
-                    toolbutton[7].setChecked(False)
-            self.toolbuttons[title][7].setChecked(True)
-        else:
-            self.toolbuttons[title][7].setChecked(False)
+        self._toggle_selector(
+            _("Delete-Selector"), self.project["glwidget"].toggle_delete_selector
+        )
 
     def _toolbar_toggle_object_selector(self) -> None:
         """delete selector."""
-        title = _("Object-Selector")
-        if self.project["glwidget"].toggle_object_selector():
-            for toolbutton in self.toolbuttons.values():
-                if toolbutton[5]:
-                    toolbutton[7].setChecked(False)
-            self.toolbuttons[title][7].setChecked(True)
-        else:
-            self.toolbuttons[title][7].setChecked(False)
+        self._toggle_selector(
+            _("Object-Selector"), self.project["glwidget"].toggle_object_selector
+        )
 
     def _toolbar_toggle_start_selector(self) -> None:
         """start selector."""
-        title = _("Start-Selector")
-        if self.project["glwidget"].toggle_start_selector():
-            for toolbutton in self.toolbuttons.values():
-                if toolbutton[5]:
-                    toolbutton[7].setChecked(False)
-            self.toolbuttons[title][7].setChecked(True)
-        else:
-            self.toolbuttons[title][7].setChecked(False)
+        self._toggle_selector(
+            _("Start-Selector"), self.project["glwidget"].toggle_start_selector
+        )
 
     def _toolbar_toggle_repair_selector(self) -> None:
         """start selector."""
-        title = _("Repair-Selector")
-        if self.project["glwidget"].toggle_repair_selector():
-            for toolbutton in self.toolbuttons.values():
-                if toolbutton[5]:
-                    toolbutton[7].setChecked(False)
-            self.toolbuttons[title][7].setChecked(True)
-        else:
-            self.toolbuttons[title][7].setChecked(False)
+        self._toggle_selector(
+            _("Repair-Selector"), self.project["glwidget"].toggle_repair_selector
+        )
 
     def _toolbar_view_reset(self) -> None:
         """center view."""
         self.project["glwidget"].view_reset()
 
     def machine_cmd_save(self, filename: str) -> bool:
-        with open(filename, "w") as fd_machine_cmd:
-            fd_machine_cmd.write(self.project["machine_cmd"])
-            fd_machine_cmd.write("\n")
-            if self.project["setup"]["machine"]["postcommand"]:
-                cmd = f"{self.project['setup']['machine']['postcommand']} '{filename}'"
-                eprint(f"executing postcommand: {cmd}")
-                os.system(f"{cmd} &")
-            return True
-        return False
+        with open(filename, "wb") as fd_machine_cmd:
+            fd_machine_cmd.write(f"{self.project['machine_cmd']}\n".encode("utf-8"))
+        postcommand = self.project["setup"]["machine"]["postcommand"]
+        if postcommand:
+            cmd = shlex.split(postcommand) + [filename]
+            eprint(f"executing postcommand: {shlex.join(cmd)}")
+            try:
+                subprocess.Popen(  # pylint: disable=R1732
+                    cmd,
+                    stdin=subprocess.DEVNULL,
+                    start_new_session=True,
+                )
+            except OSError as error:
+                eprint(f"ERROR while executing postcommand: {error}")
+        return True
 
     def status_bar_message(self, message) -> None:
         if self.status_bar:
@@ -917,18 +954,15 @@ class ViaConstructor:
     def _toolbar_save_machine_cmd(self) -> None:
         """save machine_cmd."""
         self.status_bar_message(f"{self.info} - save machine_cmd..")
-        file_dialog = QFileDialog(self.main)
-        file_dialog.setNameFilters(
-            [f"{self.project['suffix']} (*.{self.project['suffix']})"]
+        self.project["filename_machine_cmd"] = with_suffix(
+            self.project["filename_draw"], self.project["suffix"]
         )
-        self.project[
-            "filename_machine_cmd"
-        ] = f"{'.'.join(self.project['filename_draw'].split('.')[:-1])}.{self.project['suffix']}"
-        name = file_dialog.getSaveFileName(
+        name = QFileDialog.getSaveFileName(
             self.main,
             "Save File",
             self.project["filename_machine_cmd"],
             f"{self.project['suffix']} (*.{self.project['suffix']})",
+            options=FILE_DIALOG_OPTIONS,
         )
         if name[0] and self.machine_cmd_save(name[0]):
             self.status_bar_message(
@@ -940,16 +974,15 @@ class ViaConstructor:
     def _toolbar_save_dxf(self) -> None:
         """save doawing as dxf."""
         self.status_bar_message(f"{self.info} - save drawing as dxf..")
-        file_dialog = QFileDialog(self.main)
-        file_dialog.setNameFilters(["dxf (*.dxf)"])
-        self.project[
-            "filename_machine_cmd"
-        ] = f"{'.'.join(self.project['filename_draw'].split('.')[:-1])}.dxf"
-        name = file_dialog.getSaveFileName(
+        self.project["filename_machine_cmd"] = with_suffix(
+            self.project["filename_draw"], "dxf"
+        )
+        name = QFileDialog.getSaveFileName(
             self.main,
             "Save File",
             self.project["filename_machine_cmd"],
             "dxf (*.dxf)",
+            options=FILE_DIALOG_OPTIONS,
         )
         if name[0] and self.save_objects_as_dxf(name[0]):
             self.status_bar_message(f"{self.info} - save dxf..done ({name[0]})")
@@ -959,15 +992,15 @@ class ViaConstructor:
     def _toolbar_load_drawing(self) -> None:
         """load drawing."""
         self.status_bar_message(f"{self.info} - load drawing..")
-        file_dialog = QFileDialog(self.main)
-        file_dialog.setNameFilters(["drawing (*.dxf)"])
-        name = file_dialog.getOpenFileName(
-            self.main, "Load Drawing", "", "drawing (*.dxf)"
+        name = QFileDialog.getOpenFileName(
+            self.main,
+            "Load Drawing",
+            "",
+            "drawing (*.dxf)",
+            options=FILE_DIALOG_OPTIONS,
         )
         if name[0] and self.load_drawing(name[0]):
-            self.update_table()
             self.global_changed(0)
-            self.update_drawing()
 
             self.create_toolbar()
 
@@ -985,13 +1018,13 @@ class ViaConstructor:
 
     def setup_load(self, filename: str) -> bool:
         if os.path.isfile(filename):
-            setup = open(filename, "r").read()
-            return self.setup_load_string(setup)
+            with open(filename, "r") as fd_setup:
+                return self.setup_load_string(fd_setup.read())
         return False
 
     def setup_save(self, filename: str) -> bool:
         with open(filename, "w") as fd_setup:
-            fd_setup.write(json.dumps(self.project["setup"], indent=4, sort_keys=True))
+            json.dump(self.project["setup"], fd_setup, indent=4, sort_keys=True)
             return True
         return False
 
@@ -1006,10 +1039,12 @@ class ViaConstructor:
     def _toolbar_load_setup_from(self) -> None:
         """load setup from."""
         self.status_bar_message(f"{self.info} - load setup from..")
-        file_dialog = QFileDialog(self.main)
-        file_dialog.setNameFilters(["setup (*.json)"])
-        name = file_dialog.getOpenFileName(
-            self.main, "Load Setup", self.args.setup, "setup (*.json)"
+        name = QFileDialog.getOpenFileName(
+            self.main,
+            "Load Setup",
+            self.args.setup,
+            "setup (*.json)",
+            options=FILE_DIALOG_OPTIONS,
         )
         if name[0] and self.setup_load(name[0]):
             self.project["status"] = "CHANGE"
@@ -1025,10 +1060,12 @@ class ViaConstructor:
     def _toolbar_save_setup_as(self) -> None:
         """save setup as."""
         self.status_bar_message(f"{self.info} - save setup as..")
-        file_dialog = QFileDialog(self.main)
-        file_dialog.setNameFilters(["setup (*.json)"])
-        name = file_dialog.getSaveFileName(
-            self.main, "Save Setup", self.args.setup, "setup (*.json)"
+        name = QFileDialog.getSaveFileName(
+            self.main,
+            "Save Setup",
+            self.args.setup,
+            "setup (*.json)",
+            options=FILE_DIALOG_OPTIONS,
         )
         if name[0] and self.setup_save(name[0]):
             self.status_bar_message(f"{self.info} - save setup as..done ({name[0]})")
@@ -1071,14 +1108,64 @@ class ViaConstructor:
 
     def update_layers(self) -> None:
         if "layerwidget" in self.project:
-            self.project["layerwidget"].setRowCount(len(self.project["layers"]))
-            row_idx = 0
-            for layer, enabled in self.project["layers"].items():
-                self.project["layerwidget"].setItem(row_idx, 0, QTableWidgetItem(layer))
-                self.project["layerwidget"].setItem(
-                    row_idx, 1, QTableWidgetItem("enabled" if enabled else "disabled")
-                )
-                row_idx += 1
+            layerwidget = self.project["layerwidget"]
+            # repaint once after all rows are set
+            layerwidget.setUpdatesEnabled(False)
+            try:
+                layerwidget.setRowCount(len(self.project["layers"]))
+                for row_idx, (layer, enabled) in enumerate(
+                    self.project["layers"].items()
+                ):
+                    layerwidget.setItem(row_idx, 0, QTableWidgetItem(layer))
+                    layerwidget.setItem(
+                        row_idx,
+                        1,
+                        QTableWidgetItem("enabled" if enabled else "disabled"),
+                    )
+            finally:
+                layerwidget.setUpdatesEnabled(True)
+
+    def cached_gllist(self, name: str, key: tuple, draw_func) -> int:
+        """compiles draw_func() into a display list, reused while key is unchanged."""
+        glcache = self.project["glcache"]
+        if name in glcache:
+            (cached_key, gllist) = glcache[name]
+            if cached_key == key and GL.glIsList(gllist):
+                return gllist
+            if GL.glIsList(gllist):
+                GL.glDeleteLists(gllist, 1)
+        gllist = GL.glGenLists(1)
+        GL.glNewList(gllist, GL.GL_COMPILE)
+        reset_state()
+        draw_func()
+        GL.glEndList()
+        glcache[name] = (key, gllist)
+        return gllist
+
+    def draw_machinecode_path(self) -> None:
+        """draws the machinecode path and reports errors."""
+        debug("update_drawing: draw_machinecode_path")
+        if not draw_machinecode_path(self.project):
+            self.status_bar_message(
+                f"{self.info} - error while drawing machine commands"
+            )
+        debug("update_drawing: draw_machinecode_path done")
+
+    def schedule_update(self, *parts: str) -> None:
+        """collects "table" and "drawing" updates and runs them once per event loop pass."""
+        self.pending_updates = self.pending_updates | set(parts)
+        if self.update_timer is None:
+            self.run_updates()
+        else:
+            self.update_timer.start()
+
+    def run_updates(self) -> None:
+        parts = self.pending_updates
+        self.pending_updates = set()
+        if "table" in parts:
+            self.update_table()
+        if "drawing" in parts:
+            self.update_drawing()
 
     def update_drawing(self, draw_only=False) -> None:
         """update drawings."""
@@ -1091,47 +1178,86 @@ class ViaConstructor:
             debug("update_drawing: run_calculation")
             self.run_calculation()
             debug("update_drawing: run_calculation done")
+
+        # without a widget (command line mode) there is no gl context to draw into
+        if self.project["glwidget"]:
+            self.compile_drawing()
+        self.info = f"{self.project['minMax'][2] - self.project['minMax'][0]}x{self.project['minMax'][3] - self.project['minMax'][1]}mm"
+        if self.main:
+            self.main.setWindowTitle("viaConstructor")
+        self.status_bar_message(f"{self.info} - calculate..done")
+        self.update_layers()
+
+    def compile_drawing(self) -> None:
+        """compiles the drawings into the main display list."""
+        glwidget = self.project["glwidget"]
+        # also called from events outside paintGL, the lists need the gl context
+        if not glwidget.isValid():
+            return
+        glwidget.makeCurrent()
+        glwidget.dirty = True
+        # grid and machine path only change with their inputs, not on every update
+        setup = self.project["setup"]
+        view = setup["view"]
+        grid_list = self.cached_gllist(
+            "grid",
+            (
+                tuple(self.project["minMax"]),
+                view["grid_size"],
+                view["grid_show"],
+                view["ruler_show"],
+                setup["workpiece"]["offset_z"],
+                setup["mill"]["depth"],
+                setup["machine"]["unit"],
+            ),
+            lambda: draw_grid(self.project),
+        )
+        path_list = None
+        if glwidget.selector_mode != "repair":
+            path_list = self.cached_gllist(
+                "machinecode_path",
+                (
+                    self.project["machine_cmd"],
+                    self.project["suffix"],
+                    setup["tool"]["diameter"],
+                    view["path"],
+                    setup["machine"]["g54"],
+                    setup["machine"]["unit"],
+                    setup["workpiece"]["offset_x"],
+                    setup["workpiece"]["offset_y"],
+                    setup["workpiece"]["offset_z"],
+                ),
+                self.draw_machinecode_path,
+            )
+
+        if self.project["gllist"] and GL.glIsList(self.project["gllist"]):
+            GL.glDeleteLists(self.project["gllist"], 1)
         self.project["gllist"] = GL.glGenLists(1)
         GL.glNewList(self.project["gllist"], GL.GL_COMPILE)
-        draw_grid(self.project)
-        if self.project["setup"]["view"]["3d_show"]:
-            if hasattr(self.draw_reader, "draw_3d"):
-                self.draw_reader.draw_3d()
+        GL.glCallList(grid_list)
         if (
-            self.project["glwidget"]
-            and self.project["glwidget"].selector_mode != "repair"
+            view["3d_show"]
+            and self.draw_reader is not None
+            and hasattr(self.draw_reader, "draw_3d")
         ):
-            debug("update_drawing: draw_machinecode_path")
-            if not draw_machinecode_path(self.project):
-                self.status_bar_message(
-                    f"{self.info} - error while drawing machine commands"
-                )
-            debug("update_drawing: draw_machinecode_path done")
+            self.draw_reader.draw_3d()
+        if path_list is not None:
+            GL.glCallList(path_list)
+        # the called lists and the reader have changed the state
+        reset_state()
 
-        if self.project["setup"]["view"]["object_ids"]:
+        if view["object_ids"]:
             debug("update_drawing: draw_object_ids")
             draw_object_ids(self.project)
             debug("update_drawing: draw_object_ids done")
 
-        selected = -1
-        if (
-            self.project["glwidget"]
-            and self.project["glwidget"].selection_set
-            and self.project["glwidget"].selector_mode in {"delete", "oselect"}
-        ):
-            selected = self.project["glwidget"].selection_set[2]
-
+        selected = self.selected_object()
         debug("update_drawing: draw_object_edges")
         draw_object_edges(self.project, selected=selected)
-        if self.project["setup"]["view"]["polygon_show"]:
+        if view["polygon_show"]:
             draw_object_faces(self.project)
         debug("update_drawing: draw_object_edges done")
         GL.glEndList()
-        self.info = f"{self.project['minMax'][2] - self.project['minMax'][0]}x{self.project['minMax'][3] - self.project['minMax'][1]}mm"
-        if self.main:
-            self.main.setWindowTitle("viaConstructor")
-        self.status_bar_message(f"{self.info} - calculate..done")
-        self.update_layers()
 
     def materials_select(self, material_idx) -> None:
         """calculates the milling feedrate and tool-speed for the selected material
@@ -1225,37 +1351,49 @@ class ViaConstructor:
             return
 
         entry_type = self.project["setup_defaults"][sname][ename]["type"]
-        if entry_type == "bool":
-            value = bool(value == 2)
-        elif entry_type == "select":
-            value = str(value)
-        elif entry_type == "float":
-            value = float(value)
-        elif entry_type == "int":
-            value = int(value)
-        elif entry_type == "str":
-            value = str(value)
-        elif entry_type == "table":
-            pass
-        elif entry_type == "color":
-            pass
+        value_type = OBJECT_VALUE_TYPES.get(entry_type)
+        if value_type:
+            value = value_type(value)
         else:
             eprint(f"Unknown setup-type: {entry_type}")
             value = None
         self.project["objects"][obj_idx]["setup"][sname][ename] = value
         self.project["maxOuter"] = find_tool_offsets(self.project["objects"])
-        self.update_drawing()
+        self.schedule_update("drawing")
 
     def update_table(self) -> None:
         """update objects table."""
+        objwidget = self.project["objwidget"]
+        # repaint once after all rows and widgets are set
+        objwidget.setUpdatesEnabled(False)
+        try:
+            self.fill_table()
+        finally:
+            objwidget.setUpdatesEnabled(True)
 
-        selected = -1
+    def selected_object(self):
+        """gets the index of the object selected for delete or setup, or -1."""
+        glwidget = self.project["glwidget"]
         if (
-            self.project["glwidget"]
-            and self.project["glwidget"].selection_set
-            and self.project["glwidget"].selector_mode in {"delete", "oselect"}
+            glwidget
+            and glwidget.selection_set
+            and glwidget.selector_mode in {"delete", "oselect"}
         ):
-            selected = self.project["glwidget"].selection_set[2]
+            return glwidget.selection_set[2]
+        return -1
+
+    def fill_table(self) -> None:
+        """fills the objects table."""
+        selected = self.selected_object()
+        too_many = len(self.project["objects"]) >= 50
+        if (
+            too_many
+            and self.project["objwidget"].model() is self.project["objmodel"]
+            and self.project["objmodel"].rowCount() == 0
+        ):
+            # the table is already empty
+            debug(f"update_table: too many objects: {len(self.project['objects'])}")
+            return
 
         debug("update_table: clear")
         self.project["objmodel"].clear()
@@ -1264,7 +1402,7 @@ class ViaConstructor:
         self.project["objwidget"].setModel(self.project["objmodel"])
         root = self.project["objmodel"].invisibleRootItem()
 
-        if len(self.project["objects"]) >= 50:
+        if too_many:
             debug(f"update_table: too many objects: {len(self.project['objects'])}")
             return
         debug("update_table: loading")
@@ -1420,52 +1558,36 @@ class ViaConstructor:
         if self.project["status"] == "CHANGE":
             return
 
-        old_setup = deepcopy(self.project["setup"])
-        for sname in self.project["setup_defaults"]:
-            for ename, entry in self.project["setup_defaults"][sname].items():
-                if entry["type"] == "bool":
-                    self.project["setup"][sname][ename] = entry["widget"].isChecked()
-                elif entry["type"] == "select":
-                    self.project["setup"][sname][ename] = entry["widget"].currentText()
-                elif entry["type"] == "float":
-                    self.project["setup"][sname][ename] = entry["widget"].value()
-                elif entry["type"] == "int":
-                    self.project["setup"][sname][ename] = entry["widget"].value()
-                elif entry["type"] == "str":
-                    self.project["setup"][sname][ename] = entry["widget"].text()
-                elif entry["type"] == "table":
-                    for row_idx in range(entry["widget"].rowCount()):
-                        col_idx = 0
-                        for key, col_type in entry["columns"].items():
-                            if entry["widget"].item(row_idx, col_idx + 1) is None:
+        setup = self.project["setup"]
+        old_setup = copy_setup(setup)
+        for sname, section_defaults in self.project["setup_defaults"].items():
+            section_setup = setup[sname]
+            for ename, entry in section_defaults.items():
+                entry_type = entry["type"]
+                widget = entry.get("widget")
+                getter = WIDGET_VALUE_GETTERS.get(entry_type)
+                if getter:
+                    section_setup[ename] = getter(widget)
+                elif entry_type == "table":
+                    rows = section_setup[ename]
+                    for row_idx in range(widget.rowCount()):
+                        for col_idx, (key, col_type) in enumerate(
+                            entry["columns"].items(), 1
+                        ):
+                            item = widget.item(row_idx, col_idx)
+                            if item is None:
                                 print("TABLE_ERROR")
                                 continue
                             if col_type == "str":
-                                value = (
-                                    entry["widget"].item(row_idx, col_idx + 1).text()
-                                )
-                                self.project["setup"][sname][ename][row_idx][key] = str(
-                                    value
-                                )
+                                rows[row_idx][key] = str(item.text())
                             elif col_type == "int":
-                                value = (
-                                    entry["widget"].item(row_idx, col_idx + 1).text()
-                                )
-                                self.project["setup"][sname][ename][row_idx][key] = int(
-                                    value
-                                )
+                                rows[row_idx][key] = int(item.text())
                             elif col_type == "float":
-                                value = (
-                                    entry["widget"].item(row_idx, col_idx + 1).text()
-                                )
-                                self.project["setup"][sname][ename][row_idx][
-                                    key
-                                ] = float(value)
-                            col_idx += 1
-                elif entry["type"] == "color":
+                                rows[row_idx][key] = float(item.text())
+                elif entry_type == "color":
                     pass
                 else:
-                    eprint(f"Unknown setup-type: {entry['type']}")
+                    eprint(f"Unknown setup-type: {entry_type}")
 
         if self.project["setup"]["mill"]["step"] >= 0.0:
             self.project["setup"]["mill"]["step"] = -0.05
@@ -1473,40 +1595,43 @@ class ViaConstructor:
         if not self.draw_reader:
             return
 
-        self.project["segments"] = deepcopy(self.project["segments_org"])
-        self.project["segments"] = clean_segments(self.project["segments"])
+        self.project["segments"] = clean_segments(
+            [segment.copy() for segment in self.project["segments_org"]]
+        )
+        changed = [
+            (sect, key, global_value, old_setup[sect][key])
+            for sect in ("tool", "mill", "pockets", "tabs", "leads")
+            for key, global_value in setup[sect].items()
+            if global_value != old_setup[sect][key]
+        ]
         for obj in self.project["objects"].values():
-            for sect in ("tool", "mill", "pockets", "tabs", "leads"):
-                for key, global_value in self.project["setup"][sect].items():
-                    # change object value only if the value changed and the value diffs again the last value in global
-                    if (
-                        global_value != old_setup[sect][key]
-                        and obj["setup"][sect][key] == old_setup[sect][key]
-                    ):
-                        obj["setup"][sect][key] = self.project["setup"][sect][key]
+            obj_setup = obj["setup"]
+            for sect, key, global_value, old_value in changed:
+                # change object value only if the value changed and the value diffs again the last value in global
+                if obj_setup[sect][key] == old_value:
+                    obj_setup[sect][key] = global_value
 
         self.project["maxOuter"] = find_tool_offsets(self.project["objects"])
 
-        self.update_table()
-        self.update_drawing()
+        self.schedule_update("table", "drawing")
 
     def _toolbar_load_machine_cmd_setup(self) -> None:
-        self.project[
-            "filename_machine_cmd"
-        ] = f"{'.'.join(self.project['filename_draw'].split('.')[:-1])}.{self.project['suffix']}"
+        self.project["filename_machine_cmd"] = with_suffix(
+            self.project["filename_draw"], self.project["suffix"]
+        )
         if os.path.isfile(self.project["filename_machine_cmd"]):
             self.status_bar_message(
                 f"{self.info} - loading setup from machinecode: {self.project['filename_machine_cmd']}"
             )
             with open(self.project["filename_machine_cmd"], "r") as fd_machine_cmd:
-                gdata = fd_machine_cmd.read()
-                for g_line in gdata.split("\n"):
+                # reads line by line and stops at the setup line
+                for g_line in fd_machine_cmd:
                     if g_line.startswith("(setup={"):
-                        setup_json = g_line.strip("()").split("=", 1)[1]
+                        setup_json = g_line.rstrip("\n").strip("()").split("=", 1)[1]
                         ndata = json.loads(setup_json)
-                        for sname in self.project["setup"]:
-                            self.project["setup"][sname].update(ndata.get(sname, {}))
-                        self.update_drawing()
+                        # the same setup gives the same drawing
+                        if merge_setup(self.project["setup"], ndata):
+                            self.update_drawing()
                         self.status_bar_message(
                             f"{self.info} - loading setup from machinecode..done"
                         )
@@ -1519,11 +1644,20 @@ class ViaConstructor:
             print(self.project["machine_cmd"])
         sys.exit(0)
 
+    def _icon(self, name: str) -> QIcon:
+        """gets an icon from the icons folder, each file is loaded once."""
+        if name not in self.icons:
+            self.icons[name] = QIcon(os.path.join(self.module_root, "icons", name))
+        return self.icons[name]
+
     def create_toolbar(self) -> None:
         """creates the_toolbar."""
         if self.toolbar is None:
             self.toolbar = QToolBar("top toolbar")
             self.main.addToolBar(self.toolbar)  # type: ignore
+        # the old actions are owned by the main window, not the toolbar
+        for action in self.toolbar.actions():
+            action.deleteLater()
         self.toolbar.clear()
 
         if self.draw_reader is not None:
@@ -1776,13 +1910,12 @@ class ViaConstructor:
 
         section = ""
         for title, toolbutton in self.toolbuttons.items():
-            icon = os.path.join(self.module_root, "icons", toolbutton[0])
             if toolbutton[6] != section:
                 self.toolbar.addSeparator()
                 section = toolbutton[6]
             if toolbutton[4]:
                 action = QAction(
-                    QIcon(icon),
+                    self._icon(toolbutton[0]),
                     title,
                     self.main,
                 )
@@ -1797,63 +1930,64 @@ class ViaConstructor:
                 toolbutton[7] = action
 
     def update_global_setup(self) -> None:
+        setup = self.project["setup"]
         for sname in self.project["setup_defaults"]:
             for ename, entry in self.project["setup_defaults"][sname].items():
+                value = setup[sname][ename]
                 if entry["type"] == "bool":
-                    entry["widget"].setChecked(self.project["setup"][sname][ename])
+                    entry["widget"].setChecked(value)
                 elif entry["type"] == "select":
-                    entry["widget"].setCurrentText(self.project["setup"][sname][ename])
+                    entry["widget"].setCurrentText(value)
                 elif entry["type"] == "float":
-                    entry["widget"].setValue(self.project["setup"][sname][ename])
+                    entry["widget"].setValue(value)
                 elif entry["type"] == "int":
-                    entry["widget"].setValue(self.project["setup"][sname][ename])
+                    entry["widget"].setValue(value)
                 elif entry["type"] == "str":
-                    entry["widget"].setText(self.project["setup"][sname][ename])
+                    entry["widget"].setText(value)
                 elif entry["type"] == "table":
+                    columns = entry["columns"]
+                    selectable = entry["selectable"]
                     # add empty row if not exist
-                    first_element = list(entry["columns"].keys())[0]
-                    if (
-                        str(self.project["setup"][sname][ename][-1][first_element])
-                        != ""
-                    ):
-                        new_row = {}
-                        for key, default in entry["column_defaults"].items():
-                            new_row[key] = default
-                        self.project["setup"][sname][ename].append(new_row)
+                    if str(value[-1][next(iter(columns))]) != "":
+                        value.append(dict(entry["column_defaults"]))
 
                     table = entry["widget"]
-                    table.setRowCount(len(self.project["setup"][sname][ename]))
+                    table.setRowCount(len(value))
                     idxf_offset = 0
-                    table.setColumnCount(len(entry["columns"]))
-                    if entry["selectable"]:
-                        table.setColumnCount(len(entry["columns"]) + 1)
+                    table.setColumnCount(len(columns))
+                    if selectable:
+                        table.setColumnCount(len(columns) + 1)
                         table.setHorizontalHeaderItem(0, QTableWidgetItem("Select"))
                         idxf_offset = 1
-                    for col_idx, title in enumerate(entry["columns"]):
+                    for col_idx, title in enumerate(columns):
                         table.setHorizontalHeaderItem(
                             col_idx + idxf_offset, QTableWidgetItem(title)
                         )
-                    for row_idx, row in enumerate(self.project["setup"][sname][ename]):
-                        if entry["selectable"]:
-                            button = QPushButton()
-                            button.setIcon(
-                                QIcon(
-                                    os.path.join(
-                                        self.module_root, "icons", "select.png"
+                    # the values come from the setup, no need to call global_changed per cell
+                    table.setUpdatesEnabled(False)
+                    table.blockSignals(True)
+                    try:
+                        # keeps the buttons and items of the rows that already exist
+                        for row_idx, row in enumerate(value):
+                            if selectable and not table.cellWidget(row_idx, 0):
+                                button = QPushButton()
+                                button.setIcon(self._icon("select.png"))
+                                button.setToolTip(_("select this row"))
+                                button.clicked.connect(partial(self.table_select, sname, ename, row_idx))  # type: ignore
+                                table.setCellWidget(row_idx, 0, button)
+                            for col_idx, key in enumerate(columns, idxf_offset):
+                                text = str(row[key])
+                                item = table.item(row_idx, col_idx)
+                                if item is None:
+                                    table.setItem(
+                                        row_idx, col_idx, QTableWidgetItem(text)
                                     )
-                                )
-                            )
-                            button.setToolTip(_("select this row"))
-                            button.clicked.connect(partial(self.table_select, sname, ename, row_idx))  # type: ignore
-                            table.setCellWidget(row_idx, 0, button)
-                            table.resizeColumnToContents(0)
-                        for col_idx, key in enumerate(entry["columns"]):
-                            table.setItem(
-                                row_idx,
-                                col_idx + idxf_offset,
-                                QTableWidgetItem(str(row[key])),
-                            )
-                            table.resizeColumnToContents(col_idx + idxf_offset)
+                                elif item.text() != text:
+                                    item.setText(text)
+                        table.resizeColumnsToContents()
+                    finally:
+                        table.blockSignals(False)
+                        table.setUpdatesEnabled(True)
 
                 elif entry["type"] == "color":
                     pass
@@ -1861,6 +1995,7 @@ class ViaConstructor:
                     eprint(f"Unknown setup-type: {entry['type']}")
 
     def create_global_setup(self, tabwidget) -> None:
+        setup = self.project["setup"]
         for sname in self.project["setup_defaults"]:
             vcontainer = QWidget()
             vlayout = QVBoxLayout(vcontainer)
@@ -1871,9 +2006,10 @@ class ViaConstructor:
                 label = QLabel(entry.get("title", ename))
                 hlayout.addWidget(label)
                 vlayout.addWidget(container)
+                value = setup[sname][ename]
                 if entry["type"] == "bool":
                     checkbox = QCheckBox(entry.get("title", ename))
-                    checkbox.setChecked(self.project["setup"][sname][ename])
+                    checkbox.setChecked(value)
                     checkbox.setToolTip(entry.get("tooltip", f"{sname}/{ename}"))
                     checkbox.stateChanged.connect(self.global_changed)  # type: ignore
                     hlayout.addWidget(checkbox)
@@ -1882,14 +2018,13 @@ class ViaConstructor:
                     combobox = QComboBox()
                     for option in entry["options"]:
                         combobox.addItem(option[0])
-                    combobox.setCurrentText(self.project["setup"][sname][ename])
+                    combobox.setCurrentText(value)
                     combobox.setToolTip(entry.get("tooltip", f"{sname}/{ename}"))
                     combobox.currentTextChanged.connect(self.global_changed)  # type: ignore
                     hlayout.addWidget(combobox)
                     entry["widget"] = combobox
                 elif entry["type"] == "color":
-                    color = self.project["setup"][sname][ename]
-                    rgb = f"{color[0] * 255:1.0f},{color[1] * 255:1.0f},{color[2] * 255:1.0f}"
+                    rgb = f"{value[0] * 255:1.0f},{value[1] * 255:1.0f},{value[2] * 255:1.0f}"
                     button = QPushButton(rgb)
                     button.setStyleSheet(f"background-color:rgb({rgb})")
                     button.setToolTip(entry.get("tooltip", f"{sname}/{ename}"))
@@ -1902,7 +2037,7 @@ class ViaConstructor:
                     spinbox.setSingleStep(entry.get("step", 1.0))
                     spinbox.setMinimum(entry["min"])
                     spinbox.setMaximum(entry["max"])
-                    spinbox.setValue(self.project["setup"][sname][ename])
+                    spinbox.setValue(value)
                     spinbox.setToolTip(entry.get("tooltip", f"{sname}/{ename}"))
                     spinbox.valueChanged.connect(self.global_changed)  # type: ignore
                     hlayout.addWidget(spinbox)
@@ -1912,64 +2047,50 @@ class ViaConstructor:
                     spinbox.setSingleStep(entry.get("step", 1))
                     spinbox.setMinimum(entry["min"])
                     spinbox.setMaximum(entry["max"])
-                    spinbox.setValue(self.project["setup"][sname][ename])
+                    spinbox.setValue(value)
                     spinbox.setToolTip(entry.get("tooltip", f"{sname}/{ename}"))
                     spinbox.valueChanged.connect(self.global_changed)  # type: ignore
                     hlayout.addWidget(spinbox)
                     entry["widget"] = spinbox
                 elif entry["type"] == "str":
                     lineedit = QLineEdit()
-                    lineedit.setText(self.project["setup"][sname][ename])
+                    lineedit.setText(value)
                     lineedit.setToolTip(entry.get("tooltip", f"{sname}/{ename}"))
                     lineedit.textChanged.connect(self.global_changed)  # type: ignore
                     hlayout.addWidget(lineedit)
                     entry["widget"] = lineedit
                 elif entry["type"] == "table":
+                    columns = entry["columns"]
+                    selectable = entry["selectable"]
                     # add empty row if not exist
-                    first_element = list(entry["columns"].keys())[0]
-                    if (
-                        str(self.project["setup"][sname][ename][-1][first_element])
-                        != ""
-                    ):
-                        new_row = {}
-                        for key, default in entry["column_defaults"].items():
-                            new_row[key] = default
-                        self.project["setup"][sname][ename].append(new_row)
+                    if str(value[-1][next(iter(columns))]) != "":
+                        value.append(dict(entry["column_defaults"]))
 
                     table = QTableWidget()
                     label.setToolTip(entry.get("tooltip", f"{sname}/{ename}"))
-                    table.setRowCount(len(self.project["setup"][sname][ename]))
+                    table.setRowCount(len(value))
                     idxf_offset = 0
-                    table.setColumnCount(len(entry["columns"]))
-                    if entry["selectable"]:
-                        table.setColumnCount(len(entry["columns"]) + 1)
+                    table.setColumnCount(len(columns))
+                    if selectable:
+                        table.setColumnCount(len(columns) + 1)
                         table.setHorizontalHeaderItem(0, QTableWidgetItem("Select"))
                         idxf_offset = 1
-                    for col_idx, title in enumerate(entry["columns"]):
+                    for col_idx, title in enumerate(columns):
                         table.setHorizontalHeaderItem(
                             col_idx + idxf_offset, QTableWidgetItem(title)
                         )
-                    for row_idx, row in enumerate(self.project["setup"][sname][ename]):
-                        if entry["selectable"]:
+                    for row_idx, row in enumerate(value):
+                        if selectable:
                             button = QPushButton()
-                            button.setIcon(
-                                QIcon(
-                                    os.path.join(
-                                        self.module_root, "icons", "select.png"
-                                    )
-                                )
-                            )
+                            button.setIcon(self._icon("select.png"))
                             button.setToolTip(_("select this row"))
                             button.clicked.connect(partial(self.table_select, sname, ename, row_idx))  # type: ignore
                             table.setCellWidget(row_idx, 0, button)
-                            table.resizeColumnToContents(0)
-                        for col_idx, key in enumerate(entry["columns"]):
+                        for col_idx, key in enumerate(columns, idxf_offset):
                             table.setItem(
-                                row_idx,
-                                col_idx + idxf_offset,
-                                QTableWidgetItem(str(row[key])),
+                                row_idx, col_idx, QTableWidgetItem(str(row[key]))
                             )
-                            table.resizeColumnToContents(col_idx + idxf_offset)
+                    table.resizeColumnsToContents()
                     table.itemChanged.connect(self.global_changed)  # type: ignore
                     vlayout.addWidget(table)
                     entry["widget"] = table
@@ -1977,57 +2098,67 @@ class ViaConstructor:
                     eprint(f"Unknown setup-type: {entry['type']}")
 
     def udate_tabs_data(self) -> None:
-        self.project["tabs"]["data"] = []
+        tabs_data: list = []
         for obj in self.project["objects"].values():
-            layer = obj.get("layer")
-            if layer.startswith("BREAKS:") or layer.startswith("_TABS"):
+            if obj.get("layer").startswith(("BREAKS:", "_TABS")):
                 obj["setup"]["mill"]["active"] = False
-                for segment in obj["segments"]:
-                    self.project["tabs"]["data"].append(
-                        (
-                            (segment.start[0], segment.start[1]),
-                            (segment.end[0], segment.end[1]),
-                        )
+                tabs_data.extend(
+                    (
+                        (segment.start[0], segment.start[1]),
+                        (segment.end[0], segment.end[1]),
                     )
+                    for segment in obj["segments"]
+                )
+        self.project["tabs"]["data"] = tabs_data
+
+    def _layer_setup(self, layer: str) -> list:
+        """gets the (section, key, value) setup changes coded in a layer name."""
+        # experimental: get some milling data from layer name (https://groups.google.com/g/dxf2gcode-users/c/q3hPQkN2OCo)
+        if layer.startswith("IGNORE:"):
+            return [("mill", "active", False)]
+        layer_setup: list = []
+        if layer.startswith("MILL:"):
+            for match in self.LAYER_REGEX.findall(layer):
+                cmd = match[0].upper()
+                value = match[1]
+                if cmd == "MILL":
+                    layer_setup.append(("mill", "active", bool(value == "1")))
+                elif cmd in ("MILLDEPTH", "MD"):
+                    layer_setup.append(("mill", "depth", -abs(float(value))))
+                elif cmd in ("SLICEDEPTH", "SD"):
+                    layer_setup.append(("mill", "step", -abs(float(value))))
+                elif cmd in ("FEEDXY", "FXY"):
+                    layer_setup.append(("tool", "rate_h", int(value)))
+                elif cmd in ("FEEDZ", "FZ"):
+                    layer_setup.append(("tool", "rate_v", int(value)))
+        return layer_setup
 
     def prepare_segments(self) -> None:
         debug("prepare_segments: copy")
-        segments = deepcopy(self.project["segments_org"])
+        segments = [segment.copy() for segment in self.project["segments_org"]]
         debug("prepare_segments: clean_segments")
         self.project["segments"] = clean_segments(segments)
         debug("prepare_segments: segments2objects")
         self.project["objects"] = segments2objects(self.project["segments"])
         self.project["layers"] = {}
         debug("prepare_segments: setup")
+        # many objects share a layer, so each layer name is parsed once
+        layer_setups: dict = {}
+        object_setup = {
+            sect: self.project["setup"][sect]
+            for sect in ("tool", "mill", "pockets", "tabs", "leads")
+        }
         for obj in self.project["objects"].values():
-            obj["setup"] = {}
-            for sect in ("tool", "mill", "pockets", "tabs", "leads"):
-                obj["setup"][sect] = deepcopy(self.project["setup"][sect])
+            obj_setup = copy_setup(object_setup)
+            obj["setup"] = obj_setup
             layer = obj.get("layer")
-            if layer.startswith("BREAKS:") or layer.startswith("_TABS"):
-                self.project["layers"][layer] = False
-            else:
-                self.project["layers"][layer] = True
-            # experimental: get some milling data from layer name (https://groups.google.com/g/dxf2gcode-users/c/q3hPQkN2OCo)
-            if layer:
-                if layer.startswith("IGNORE:"):
-                    obj["setup"]["mill"]["active"] = False
-                elif layer.startswith("MILL:"):
-                    matches = self.LAYER_REGEX.findall(obj["layer"])
-                    if matches:
-                        for match in matches:
-                            cmd = match[0].upper()
-                            value = match[1]
-                            if cmd == "MILL":
-                                obj["setup"]["mill"]["active"] = bool(value == "1")
-                            elif cmd in ("MILLDEPTH", "MD"):
-                                obj["setup"]["mill"]["depth"] = -abs(float(value))
-                            elif cmd in ("SLICEDEPTH", "SD"):
-                                obj["setup"]["mill"]["step"] = -abs(float(value))
-                            elif cmd in ("FEEDXY", "FXY"):
-                                obj["setup"]["tool"]["rate_h"] = int(value)
-                            elif cmd in ("FEEDZ", "FZ"):
-                                obj["setup"]["tool"]["rate_v"] = int(value)
+            self.project["layers"][layer] = not layer.startswith(("BREAKS:", "_TABS"))
+            layer_setup = layer_setups.get(layer)
+            if layer_setup is None:
+                layer_setup = self._layer_setup(layer)
+                layer_setups[layer] = layer_setup
+            for sect, key, value in layer_setup:
+                obj_setup[sect][key] = value
         debug("prepare_segments: udate_tabs_data")
         self.udate_tabs_data()
         debug("prepare_segments: find_tool_offsets")
@@ -2058,21 +2189,20 @@ class ViaConstructor:
 
         # find plugin
         debug("load_drawing: start")
-        suffix = filename.split(".")[-1].lower()
-        for reader_plugin in reader_plugins.values():
-            if suffix in reader_plugin.suffix():
-                self.draw_reader = reader_plugin(filename, self.args)
-                if reader_plugin.can_save_tabs:
-                    self.save_tabs = "ask"
-                break
+        suffix = os.path.splitext(filename)[1][1:].lower()
+        reader_plugin = suffix_readers.get(suffix)
+        if reader_plugin:
+            self.draw_reader = reader_plugin(filename, self.args)
+            if reader_plugin.can_save_tabs:
+                self.save_tabs = "ask"
 
         if self.draw_reader:
             debug("load_drawing: get segments")
             self.project["segments_org"] = self.draw_reader.get_segments()
             self.project["filename_draw"] = filename
-            self.project[
-                "filename_machine_cmd"
-            ] = f"{'.'.join(self.project['filename_draw'].split('.')[:-1])}.{self.project['suffix']}"
+            self.project["filename_machine_cmd"] = with_suffix(
+                self.project["filename_draw"], self.project["suffix"]
+            )
             debug("load_drawing: prepare_segments")
             self.prepare_segments()
             debug("load_drawing: done")
@@ -2148,12 +2278,18 @@ class ViaConstructor:
             if self.args.output:
                 self.update_drawing()
                 eprint(f"saving machine_cmd to file: {self.args.output}")
-                open(self.args.output, "w").write(self.project["machine_cmd"])
+                Path(self.args.output).write_bytes(
+                    self.project["machine_cmd"].encode("utf-8")
+                )
                 sys.exit(0)
 
         # gui #
         debug("main: load gui")
         qapp = QApplication(sys.argv)
+        self.update_timer = QTimer()
+        self.update_timer.setSingleShot(True)
+        self.update_timer.setInterval(0)
+        self.update_timer.timeout.connect(self.run_updates)  # type: ignore
         self.project["window"] = QWidget()
         self.project["app"] = self
 